@@ -127,7 +127,10 @@ app.layout = dbc.Container([
     dcc.Store(id='tweaker-changed-records-store', data={}),  # Stores changed records from threshold tweaking
     dcc.Store(id='tweaker-current-side-store', data='back'),  # Stores currently selected side for threshold adjustment
     dcc.Store(id='tweaker-current-page-store', data=0),  # Stores current page for tweaker pagination
+    dcc.Store(id='tweaker-filtered-count-store', data=0),  # Number of changed records the tweaker display pages over
     dcc.Store(id='tweaker-image-toggle-state-store', data={}),  # Stores image toggle states for tweaker (structure: {record_id: {side: 'input'|'result'}})
+    dcc.Store(id='tweaker-ref-matrix-cache', data=None),  # Key of the reference matrix currently rendered in the tweaker (skips re-sending an unchanged figure)
+    dcc.Store(id='tweaker-matrix-signature-store', data=None),  # Signature of the tweaker matrices currently rendered (skips recalculating unchanged inputs)
     dcc.Store(id='clipboard-copy-dummy-store', data=None),  # Dummy store for clipboard copy callbacks
     dcc.Store(id='modal-gamma-store', data=1.0),  # Stores gamma value for modal image adjustment
     
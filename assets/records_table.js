@@ -0,0 +1,11 @@
+// Expand/collapse of records table rows (Image Viewer, Cell Details, Threshold Tweaker)
+// One delegated listener serves every row header (data-expand-index), so rows need no
+// per-row Dash callback and re-rendered rows can't fire spurious toggles. The expanded state is
+// the header row's is-expanded class; custom.css shows the detail row and turns the arrow
+document.addEventListener('click', function(e) {
+    const header = e.target.closest ? e.target.closest('[data-expand-index]') : null;
+    const headerRow = header ? header.closest('tr') : null;
+    if (headerRow) {
+        headerRow.classList.toggle('is-expanded');
+    }
+});
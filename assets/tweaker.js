@@ -0,0 +1,178 @@
+// Clientside callbacks for the Threshold Tweaker tab
+window.dash_clientside = window.dash_clientside || {};
+
+(function() {
+    const ACTIVE_MODEL_STYLE = {
+        backgroundColor: '#1e40af',
+        borderColor: '#1e40af',
+        color: 'white',
+        fontWeight: '700',
+        boxShadow: '0 4px 12px rgba(30, 64, 175, 0.4)',
+        transition: 'all 0.3s ease',
+        whiteSpace: 'nowrap'
+    };
+
+    const INACTIVE_MODEL_STYLE = {
+        backgroundColor: 'white',
+        borderColor: 'white',
+        color: '#1e40af',
+        fontWeight: '600',
+        transition: 'all 0.3s ease',
+        whiteSpace: 'nowrap'
+    };
+
+    // Changed records per page (mirrors TWEAKER_RECORDS_PER_PAGE in threshold_tweaker.py)
+    const RECORDS_PER_PAGE = 10;
+
+    // Question being tweaked (mirrors _resolve_question_name in threshold_tweaker.py)
+    function resolveQuestionName(data, thresholdConfig) {
+        if (data && typeof data === 'object' && !Array.isArray(data) && data.question_name) {
+            return data.question_name;
+        }
+        const fallback = Object.keys(thresholdConfig || {}).find(function(key) {
+            return key.toLowerCase().indexOf('physicalcondition') !== -1;
+        });
+        return fallback || null;
+    }
+
+    window.dash_clientside.tweaker = {
+        // Update model toggle button states based on model store value
+        toggleModel: function(model, activeTab) {
+            const noUpdate = window.dash_clientside.no_update;
+            // Only update when on tweaker tab
+            if (activeTab !== 'tweaker') {
+                return [noUpdate, noUpdate, noUpdate, noUpdate];
+            }
+
+            // Anything other than "new" falls back to the deployed model
+            const isNew = model === 'new';
+            return [
+                !isNew,
+                isNew ? INACTIVE_MODEL_STYLE : ACTIVE_MODEL_STYLE,
+                isNew,
+                isNew ? ACTIVE_MODEL_STYLE : INACTIVE_MODEL_STYLE
+            ];
+        },
+
+        // Show only the slider group of the selected side
+        showSideGroup: function(selectedSide, groupIds) {
+            return (groupIds || []).map(function(groupId) {
+                return {display: groupId.side === selectedSide ? 'block' : 'none'};
+            });
+        },
+
+        // Update the " [min, max]" text of every mounted threshold slider
+        updateValueDisplay: function(adjustedThresholds, displayIds, thresholdConfig, data) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!adjustedThresholds || !thresholdConfig) {
+                return noUpdate;
+            }
+
+            const questionName = resolveQuestionName(data, thresholdConfig);
+            if (!questionName || !(questionName in adjustedThresholds)) {
+                return noUpdate;
+            }
+
+            const questionThresholds = adjustedThresholds[questionName] || {};
+            return (displayIds || []).map(function(displayId) {
+                const values = (questionThresholds[displayId.side] || {})[displayId.category];
+                if (!values || !values.length) {
+                    return noUpdate;
+                }
+                return ' [' + Math.trunc(values[0]) + ', ' + Math.trunc(values[1]) + ']';
+            });
+        },
+
+        // Move slider handles to the adjusted thresholds, leaving sliders that already match alone
+        // (setting an unchanged value would re-trigger the server-side slider callback)
+        patchSliderValues: function(adjustedThresholds, sliderIds, sliderValues, thresholdConfig, data) {
+            const noUpdate = window.dash_clientside.no_update;
+            if (!adjustedThresholds || !thresholdConfig) {
+                return noUpdate;
+            }
+
+            const questionName = resolveQuestionName(data, thresholdConfig);
+            if (!questionName || !(questionName in adjustedThresholds)) {
+                return noUpdate;
+            }
+
+            const questionThresholds = adjustedThresholds[questionName] || {};
+            const values = sliderValues || [];
+            return (sliderIds || []).map(function(sliderId, i) {
+                const bounds = (questionThresholds[sliderId.side] || {})[sliderId.category];
+                if (!bounds || bounds.length !== 2) {
+                    return noUpdate;
+                }
+                const target = [Math.trunc(bounds[0]), Math.trunc(bounds[1])];
+                const current = values[i];
+                if (current && current[0] === target[0] && current[1] === target[1]) {
+                    return noUpdate;
+                }
+                return target;
+            });
+        },
+
+        // Page index after a first/prev/next/last click on the changed records
+        navigateRecords: function(firstClicks, prevClicks, nextClicks, lastClicks, filteredCount, currentPage) {
+            const ctx = window.dash_clientside.callback_context;
+            const page = currentPage || 0;
+            if (!ctx || !ctx.triggered || ctx.triggered.length === 0) {
+                return page;
+            }
+
+            if (!filteredCount) {
+                return 0;
+            }
+
+            const totalPages = Math.ceil(filteredCount / RECORDS_PER_PAGE);
+            const triggerId = ctx.triggered[0].prop_id.split('.')[0];
+            if (triggerId === 'tweaker-first-btn') {
+                return 0;
+            } else if (triggerId === 'tweaker-prev-btn') {
+                return Math.max(0, page - 1);
+            } else if (triggerId === 'tweaker-next-btn') {
+                return Math.min(totalPages - 1, page + 1);
+            } else if (triggerId === 'tweaker-last-btn') {
+                return totalPages - 1;
+            }
+            return page;
+        },
+
+        // Flip an image toggle button between the input and result image of a record side
+        toggleImageState: function(nClicksList, currentStates) {
+            const noUpdate = window.dash_clientside.no_update;
+            const ctx = window.dash_clientside.callback_context;
+            if (!ctx || !ctx.triggered || ctx.triggered.length === 0) {
+                return noUpdate;
+            }
+
+            const trigger = ctx.triggered[0].prop_id;
+            if (!trigger || trigger.indexOf('.n_clicks') === -1) {
+                return noUpdate;
+            }
+
+            const buttonId = ctx.triggered_id;
+            if (!buttonId || typeof buttonId !== 'object' || !buttonId.side || buttonId.record_id == null) {
+                return noUpdate;
+            }
+
+            // New objects, so the store sees a changed value
+            const states = (currentStates && typeof currentStates === 'object' && !Array.isArray(currentStates))
+                ? Object.assign({}, currentStates) : {};
+            const previous = states[buttonId.record_id];
+            const recordStates = (previous && typeof previous === 'object' && !Array.isArray(previous))
+                ? Object.assign({}, previous) : {};
+
+            // Toggle state (default to 'input')
+            const currentMode = buttonId.side in recordStates ? recordStates[buttonId.side] : 'input';
+            recordStates[buttonId.side] = currentMode === 'input' ? 'result' : 'input';
+            states[buttonId.record_id] = recordStates;
+            return states;
+        },
+
+        // Show loading indicator immediately when an optimization button is clicked
+        showOptimizationLoader: function(optimizeAllClicks, optimizeSideClicks) {
+            return {display: 'flex', alignItems: 'center', gap: '10px'};
+        }
+    };
+})();
@@ -953,8 +953,8 @@ def register_cell_details_callbacks(app):
         
         return current_page or 0
     
-    # Note: Row expand/collapse is handled by the clientside callback in image_viewer
-    # which uses pattern matching, so it works for both tabs automatically
+    # Note: Row expand/collapse is handled by the delegated listener in assets/records_table.js
+    # (shared by every records table, so it works for both tabs automatically)
     
     # Collapse rows only when filtering/pagination changes (not when image toggle changes)
     # This ensures rows stay expanded when toggling images in cell details
@@ -969,19 +969,9 @@ def register_cell_details_callbacks(app):
             // Only collapse rows when filtered_data or current_page changes (filtering/pagination)
             // NOT when image-toggle-state-store changes
             setTimeout(function() {
-                const allExpandedRows = document.querySelectorAll('[id^="row-expanded-"]');
-                const allArrows = document.querySelectorAll('[id^="arrow-"]');
-                
                 // Collapse all rows when filtering/pagination changes
-                allExpandedRows.forEach(function(row) {
-                    if (row) {
-                        row.style.display = 'none';
-                    }
-                });
-                allArrows.forEach(function(arrow) {
-                    if (arrow) {
-                        arrow.style.transform = 'rotate(0deg)';
-                    }
+                document.querySelectorAll('.records-table .clickable-row.is-expanded').forEach(function(row) {
+                    row.classList.remove('is-expanded');
                 });
             }, 100);
             
@@ -1007,20 +997,10 @@ def register_cell_details_callbacks(app):
             // Before DOM changes, capture currently expanded rows
             // Use requestAnimationFrame to ensure we capture state before DOM updates
             const captureExpandedRows = function() {
-                const allExpandedRows = document.querySelectorAll('[id^="row-expanded-"]');
-                allExpandedRows.forEach(function(row) {
-                    if (row) {
-                        const computedStyle = window.getComputedStyle(row);
-                        const isVisible = computedStyle.display === 'table-row' || 
-                                         row.style.display === 'table-row' ||
-                                         row.offsetHeight > 0;
-                        if (isVisible) {
-                            const match = row.id.match(/row-expanded-(\\d+)/);
-                            if (match) {
-                                const index = match[1];
-                                window.preservedExpandedRowsCell.add(index);
-                            }
-                        }
+                document.querySelectorAll('.records-table .clickable-row.is-expanded').forEach(function(row) {
+                    const match = row.id.match(/row-header-(\\d+)/);
+                    if (match) {
+                        window.preservedExpandedRowsCell.add(match[1]);
                     }
                 });
             };
@@ -1037,11 +1017,9 @@ def register_cell_details_callbacks(app):
                 if (window.preservedExpandedRowsCell && window.preservedExpandedRowsCell.size > 0) {
                     let restoredCount = 0;
                     window.preservedExpandedRowsCell.forEach(function(index) {
-                        const expandedRow = document.getElementById('row-expanded-' + index);
-                        const arrow = document.getElementById('arrow-' + index);
-                        if (expandedRow && arrow) {
-                            expandedRow.style.display = 'table-row';
-                            arrow.style.transform = 'rotate(90deg)';
+                        const headerRow = document.getElementById('row-header-' + index);
+                        if (headerRow) {
+                            headerRow.classList.add('is-expanded');
                             restoredCount++;
                         }
                     });
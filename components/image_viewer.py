@@ -3,7 +3,7 @@ Image Viewer Tab Component for Analysis Dashboard
 Displays filtered records with images from all sides
 """
 
-from dash import html, dcc, Input, Output, State, callback_context, ALL, MATCH, no_update
+from dash import html, dcc, Input, Output, State, callback_context, ALL, MATCH, no_update, Patch
 import dash
 import dash_bootstrap_components as dbc
 from pathlib import Path
@@ -288,16 +288,14 @@ def create_accordion_view(records, page_index, image_toggle_states, audit_tags,
         row_header = html.Tr([
             html.Td(
                 html.Div([
-                    html.Span("▶", id=f"arrow-{global_index}", style={
-                        "display": "inline-block",
-                        "transition": "transform 0.3s ease",
+                    html.Span("▶", id=f"arrow-{global_index}", className="expand-arrow", style={
                         "marginRight": "8px",
                         "color": "#3b82f6",
                         "fontSize": "0.8em",
                         "cursor": "pointer"
                     }),
                     html.Span(date, style={"cursor": "pointer"})
-                ], id={"type": "expand-row", "index": global_index}, n_clicks=0, style={"display": "flex", "alignItems": "center"}),
+                ], style={"display": "flex", "alignItems": "center"}, **{"data-expand-index": global_index}),
                 style={"cursor": "pointer", "width": "130px"}
             ),
             html.Td(cscan),
@@ -318,14 +316,14 @@ def create_accordion_view(records, page_index, image_toggle_states, audit_tags,
             current_audit
         )
         
-        # Expandable row content
+        # Expandable row content (hidden until the header row is-expanded, see custom.css)
         row_expanded = html.Tr([
             html.Td(
                 record_content,
                 colSpan=6,
                 style={"padding": "0", "background": "#f8fafc"}
             )
-        ], id=f"row-expanded-{global_index}", style={"display": "none"}, className="expanded-row")
+        ], id=f"row-expanded-{global_index}", className="expanded-row")
         
         table_rows.append(row_header)
         table_rows.append(row_expanded)
@@ -1517,41 +1515,31 @@ def register_image_viewer_callbacks(app):
     def update_image_toggle_state(n_clicks_list, current_states):
         ctx = callback_context
         if not ctx.triggered:
-            return current_states or {}
+            return no_update
         
-        trigger = ctx.triggered[0]['prop_id']
+        # Dash hands over the pattern-matching button ID already parsed
+        button_id = ctx.triggered_id
+        if not isinstance(button_id, dict):
+            return no_update
+        clicked_side = button_id.get('side')
+        record_id = button_id.get('record_id')
+        if not clicked_side or record_id is None:
+            return no_update
         
-        # Initialize current_states if needed
+        # Initialize current_states if needed (sent whole, there is nothing to patch yet)
         if not current_states or not isinstance(current_states, dict):
-            current_states = {}
-        
-        if 'image-toggle-btn' in trigger:
-            import json
-            try:
-                trigger_dict = json.loads(trigger.split('.')[0])
-                clicked_side = trigger_dict.get('side')
-                record_id = trigger_dict.get('record_id')
-                
-                if clicked_side and record_id is not None:
-                    # Get or create state for this record using record_id (txn_id)
-                    if record_id not in current_states:
-                        current_states[record_id] = {}
-                    
-                    record_state = current_states[record_id]
-                    if not isinstance(record_state, dict):
-                        record_state = {}
-                        current_states[record_id] = record_state
-                    
-                    # Toggle the state for this specific record and side (default to 'input')
-                    current_state = record_state.get(clicked_side, 'input')
-                    new_state = 'result' if current_state == 'input' else 'input'
-                    record_state[clicked_side] = new_state
-            except Exception as e:
-                import traceback
-                print(f"❌ Error updating toggle state: {e}")
-                print(traceback.format_exc())
-        
-        return current_states
+            return {record_id: {clicked_side: 'result'}}
+        
+        # Toggle the state for this specific record and side (default to 'input'); only the
+        # changed entry is sent back instead of every record's toggle states
+        record_state = current_states.get(record_id)
+        patch = Patch()
+        if isinstance(record_state, dict):
+            current_state = record_state.get(clicked_side, 'input')
+            patch[record_id][clicked_side] = 'result' if current_state == 'input' else 'input'
+        else:
+            patch[record_id] = {clicked_side: 'result'}
+        return patch
     
     # Modal for full image view - works for both Image Viewer and Cell Details tabs
     @app.callback(
@@ -1635,10 +1623,8 @@ def register_image_viewer_callbacks(app):
                     # Tweaker tab - use tweaker_changed_records_data
                     if tweaker_changed_records_data:
                         if isinstance(tweaker_changed_records_data, dict):
-                            # Get filtered records if available, otherwise all changed records
-                            records = tweaker_changed_records_data.get("filtered", [])
-                            if not records:
-                                records = tweaker_changed_records_data.get("data", [])
+                            # Filtered records are a subset of the changed records, so search all of them
+                            records = tweaker_changed_records_data.get("data", [])
                         elif isinstance(tweaker_changed_records_data, list) and len(tweaker_changed_records_data) > 0:
                             records = tweaker_changed_records_data
                 else:
@@ -1657,9 +1643,7 @@ def register_image_viewer_callbacks(app):
                             records = cell_details_filtered_data
                     if not records and tweaker_changed_records_data:
                         if isinstance(tweaker_changed_records_data, dict):
-                            records = tweaker_changed_records_data.get("filtered", [])
-                            if not records:
-                                records = tweaker_changed_records_data.get("data", [])
+                            records = tweaker_changed_records_data.get("data", [])
                         elif isinstance(tweaker_changed_records_data, list) and len(tweaker_changed_records_data) > 0:
                             records = tweaker_changed_records_data
                 
@@ -1724,29 +1708,6 @@ def register_image_viewer_callbacks(app):
         
         return False, ""
     
-    # Store expanded row states to preserve them across re-renders
-    @app.callback(
-        Output("expanded-rows-store", "data", allow_duplicate=True),
-        Input({"type": "expand-row", "index": ALL}, "n_clicks"),
-        State("expanded-rows-store", "data"),
-        prevent_initial_call=True
-    )
-    def update_expanded_rows(n_clicks_list, current_expanded):
-        # This callback is kept for tracking, but rows always start collapsed
-        # No need to preserve state - rows are recreated with display: none
-        from dash import callback_context
-        ctx = callback_context
-        if not ctx.triggered:
-            return {}
-        
-        trigger = ctx.triggered[0]['prop_id']
-        if 'expand-row' not in trigger:
-            return {}
-        
-        # Don't preserve expanded state - rows always start collapsed when DOM is rebuilt
-        # This ensures no auto-expansion happens
-        return {}
-    
     # Collapse rows only when filtering/pagination changes (not when image toggle changes)
     # This ensures rows stay expanded when toggling images
     app.clientside_callback(
@@ -1760,19 +1721,9 @@ def register_image_viewer_callbacks(app):
             // Only collapse rows when filtered_data or current_page changes (filtering/pagination)
             // NOT when image-toggle-state-store changes
             setTimeout(function() {
-                const allExpandedRows = document.querySelectorAll('[id^="row-expanded-"]');
-                const allArrows = document.querySelectorAll('[id^="arrow-"]');
-                
                 // Collapse all rows when filtering/pagination changes
-                allExpandedRows.forEach(function(row) {
-                    if (row) {
-                        row.style.display = 'none';
-                    }
-                });
-                allArrows.forEach(function(arrow) {
-                    if (arrow) {
-                        arrow.style.transform = 'rotate(0deg)';
-                    }
+                document.querySelectorAll('.records-table .clickable-row.is-expanded').forEach(function(row) {
+                    row.classList.remove('is-expanded');
                 });
             }, 100);
             
@@ -1796,14 +1747,10 @@ def register_image_viewer_callbacks(app):
             }
             
             // Before DOM changes, capture currently expanded rows
-            const allExpandedRows = document.querySelectorAll('[id^="row-expanded-"]');
-            allExpandedRows.forEach(function(row) {
-                if (row && row.style.display === 'table-row') {
-                    const match = row.id.match(/row-expanded-(\\d+)/);
-                    if (match) {
-                        const index = match[1];
-                        window.preservedExpandedRows.add(index);
-                    }
+            document.querySelectorAll('.records-table .clickable-row.is-expanded').forEach(function(row) {
+                const match = row.id.match(/row-header-(\\d+)/);
+                if (match) {
+                    window.preservedExpandedRows.add(match[1]);
                 }
             });
             
@@ -1811,11 +1758,9 @@ def register_image_viewer_callbacks(app):
             setTimeout(function() {
                 if (window.preservedExpandedRows && window.preservedExpandedRows.size > 0) {
                     window.preservedExpandedRows.forEach(function(index) {
-                        const expandedRow = document.getElementById('row-expanded-' + index);
-                        const arrow = document.getElementById('arrow-' + index);
-                        if (expandedRow && arrow) {
-                            expandedRow.style.display = 'table-row';
-                            arrow.style.transform = 'rotate(90deg)';
+                        const headerRow = document.getElementById('row-header-' + index);
+                        if (headerRow) {
+                            headerRow.classList.add('is-expanded');
                         }
                     });
                 }
@@ -1830,124 +1775,7 @@ def register_image_viewer_callbacks(app):
         prevent_initial_call='initial_duplicate'
     )
     
-    # Set up event delegation to prevent toggle button clicks from collapsing rows
-    # This runs once on initial load
-    app.clientside_callback(
-        """
-        function(record_display) {
-            // Set up event delegation to stop propagation on toggle button clicks
-            // Don't clone/replace buttons - that breaks Dash's event tracking
-            if (!window.toggleButtonPropagationHandler) {
-                window.toggleButtonPropagationHandler = function(e) {
-                    // Check if click is on or inside a toggle button
-                    const target = e.target;
-                    const toggleBtn = target.closest ? target.closest('[id*="image-toggle-btn"]') : null;
-                    if (toggleBtn) {
-                        // Set flag so row expand/collapse handler knows to ignore this click
-                        window.lastClickWasToggleButton = true;
-                        // Also record the timestamp for additional safety check
-                        window.lastToggleButtonClickTime = Date.now();
-                        // Stop propagation to prevent row collapse
-                        // This runs in bubble phase, so Dash has already handled the click
-                        e.stopPropagation();
-                        // Clear flag after a short delay to reset for next click
-                        setTimeout(function() {
-                            window.lastClickWasToggleButton = false;
-                        }, 250);
-                    } else {
-                        // Not a toggle button click, clear flag
-                        window.lastClickWasToggleButton = false;
-                    }
-                };
-                // Use bubble phase (false) so Dash handles the click first, then we stop propagation
-                document.addEventListener('click', window.toggleButtonPropagationHandler, false);
-            }
-            
-            return window.dash_clientside.no_update;
-        }
-        """,
-        Output("audit-tags-store", "data", allow_duplicate=True),
-        Input("record-display", "children"),
-        prevent_initial_call='initial_duplicate'
-    )
-    
-    # Handle row expand/collapse - only on arrow/row header click
-    # Ignore clicks that come from toggle buttons
-    app.clientside_callback(
-        """
-        function(n_clicks_list) {
-            if (!n_clicks_list || n_clicks_list.length === 0) {
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            // Find which row was clicked
-            const ctx = window.dash_clientside.callback_context;
-            if (!ctx.triggered || ctx.triggered.length === 0) {
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            const triggered = ctx.triggered[0];
-            const propId = triggered.prop_id;
-            
-            // Only handle expand-row clicks, ignore other clicks
-            if (!propId || !propId.includes('expand-row')) {
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            // Check if the click actually came from a toggle button
-            // This prevents row collapse when toggle button is clicked
-            // First check the flag set by event delegation handler
-            if (window.lastClickWasToggleButton) {
-                window.lastClickWasToggleButton = false;
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            // Additional safety check: verify the click didn't come from inside a toggle button
-            // by checking if any toggle button was recently clicked (within last 200ms)
-            // This handles cases where the flag might not be set correctly
-            const now = Date.now();
-            if (window.lastToggleButtonClickTime && (now - window.lastToggleButtonClickTime) < 200) {
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            // Extract the index from the prop_id
-            const match = propId.match(/"index":(\\d+)/);
-            if (!match) {
-                throw window.dash_clientside.PreventUpdate;
-            }
-            
-            const index = match[1];
-            const expandedRow = document.getElementById(`row-expanded-${index}`);
-            const arrow = document.getElementById(`arrow-${index}`);
-            
-            // Final safety check: if the expanded row contains any toggle buttons that were just clicked,
-            // don't collapse the row. This prevents collapse when clicking toggle buttons.
-            if (expandedRow && expandedRow.style.display === 'table-row') {
-                // Row is currently expanded - check if any toggle button inside it was recently clicked
-                const toggleButtons = expandedRow.querySelectorAll('[id*="image-toggle-btn"]');
-                if (toggleButtons.length > 0 && window.lastToggleButtonClickTime) {
-                    const timeSinceToggle = now - window.lastToggleButtonClickTime;
-                    if (timeSinceToggle < 300) {
-                        // A toggle button was clicked recently, don't collapse
-                        throw window.dash_clientside.PreventUpdate;
-                    }
-                }
-            }
-            
-            if (expandedRow && arrow) {
-                const isHidden = expandedRow.style.display === 'none' || !expandedRow.style.display;
-                expandedRow.style.display = isHidden ? 'table-row' : 'none';
-                // Rotate arrow: ▶ (closed) → ▼ (open)
-                arrow.style.transform = isHidden ? 'rotate(90deg)' : 'rotate(0deg)';
-            }
-            
-            throw window.dash_clientside.PreventUpdate;
-        }
-        """,
-        Output("audit-tags-store", "data", allow_duplicate=True),
-        Input({"type": "expand-row", "index": ALL}, "n_clicks"),
-        prevent_initial_call=True
-    )
+    # Row expand/collapse is a delegated click listener on the row headers (assets/records_table.js)
     
     # Handle audit dropdown changes (works for both Image Viewer and Cell Details tabs)
     @app.callback(
@@ -16,6 +16,7 @@ import shutil
 import tempfile
 from datetime import datetime
 import json
+import uuid
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -649,7 +650,8 @@ def register_report_generation_callbacks(app):
                 "columns": csv_columns,
                 "source": source_mode,
                 "folder_name": output_folder_name,
-                "question_name": question_name  # Store question name from report generation
+                "question_name": question_name,  # Store question name from report generation
+                "data_key": uuid.uuid4().hex  # Identifies this dataset for server-side caches
             }
             
             # Create ZIP for generation and folder update modes
@@ -4,31 +4,86 @@ Allows users to adjust thresholds and see real-time impact on confusion matrix
 with full analysis capabilities similar to Image Viewer
 """
 
-from dash import html, dcc, Input, Output, State, callback_context, ALL, no_update
+from dash import html, dcc, Input, Output, State, callback_context, ALL, no_update, ClientsideFunction
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-from pathlib import Path
-import sys
+import numpy as np
 import pandas as pd
-import copy
+from functools import lru_cache
+from collections import OrderedDict
+import hashlib
 import json
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+try:
+    import orjson
+except ImportError:  # optional speedup - fall back to the standard library
+    orjson = None
 
 from utils.data_loader import prepare_matrix_data, create_confusion_matrix_plot
 from utils.threshold_handler import (
     load_threshold_config,
-    get_category_from_score,
     get_severity_order_from_thresholds,
     get_category_order_from_threshold,
     normalize_category_for_confusion_matrix,
     is_least_severe_category
 )
-from components.image_viewer import create_accordion_view, create_record_display_with_audit
+
+# Static side options shared by the side filter dropdowns
+_SIDES = ("top", "bottom", "left", "right", "back", "front")
+SIDE_OPTIONS = [{"label": s.title(), "value": s} for s in _SIDES]
+SIDE_OPTIONS_WITH_BLANK = SIDE_OPTIONS + [{"label": "Blank", "value": "_blank_"}]
+
+# Marks shared by every 0-100 slider (score filters and threshold sliders)
+_STD_MARKS = {i: str(i) for i in range(0, 101, 20)}
+
+# Per-side rank columns memoized during one optimization run (bounds memory on large datasets)
+_SIDE_RANK_CACHE_SIZE = 256
+
+# Worker threads scoring optimizer candidates (the NumPy rank kernels release the GIL); threads
+# start on first use, and single-core hosts score candidates inline
+_CANDIDATE_WORKERS = min(8, os.cpu_count() or 1)
+_candidate_pool = ThreadPoolExecutor(max_workers=_CANDIDATE_WORKERS, thread_name_prefix="threshold-candidates") if _CANDIDATE_WORKERS > 1 else None
+
+# Changed records shown per page (matches the page size used by create_accordion_view)
+TWEAKER_RECORDS_PER_PAGE = 10
+
+# Matrix card headers (reference, adjusted) per model
+_MATRIX_HEADERS = {
+    "old": ("Deployed Model (Reference Matrix)", "Deployed Model (Adjusted Matrix)"),
+    "new": ("New Model (Reference Matrix)", "New Model (Adjusted Matrix)"),
+}
 
 
 def validate_and_adjust_thresholds(side_thresholds: dict) -> dict:
+    """
+    Validate and adjust thresholds (memoized, see _validate_and_adjust_core).
+    
+    Args:
+        side_thresholds: Dict mapping category names to [min, max] lists
+        
+    Returns:
+        Adjusted side_thresholds dict with validated thresholds
+    """
+    if not side_thresholds:
+        return side_thresholds
+    
+    key = tuple((category, values[0], values[1]) for category, values in side_thresholds.items())
+    return {category: [min_val, max_val] for category, min_val, max_val in _validate_cached(key)}
+
+
+@lru_cache(maxsize=256)
+def _validate_cached(key: tuple) -> tuple:
+    """Cached validation keyed by ((category, min, max), ...); returns the same tuple layout"""
+    adjusted = _validate_and_adjust_core({category: [min_val, max_val] for category, min_val, max_val in key})
+    return tuple((category, values[0], values[1]) for category, values in adjusted.items())
+
+
+def _validate_and_adjust_core(side_thresholds: dict) -> dict:
     """
     Validate and adjust thresholds to ensure:
     1. No gaps: thresholds cover entire 0-100 range continuously
@@ -45,7 +100,7 @@ def validate_and_adjust_thresholds(side_thresholds: dict) -> dict:
         return side_thresholds
     
     # Get category order from dict keys (preserves insertion order from threshold.json)
-    categories = list(side_thresholds.keys())
+    categories = list(side_thresholds)
     
     if len(categories) == 0:
         return side_thresholds
@@ -54,55 +109,666 @@ def validate_and_adjust_thresholds(side_thresholds: dict) -> dict:
     if len(categories) == 1:
         return {categories[0]: [0, 100]}
     
-    # Create a copy to avoid modifying original
-    adjusted_thresholds = {}
+    # Upper bounds: the first is clamped to [1, 100], middle ones to at most 100, and each must be
+    # at least the previous upper bound + 1. Written as u[i] = i + running max of (raw[i] - i),
+    # which enforces the +1 spacing in a single cumulative-max pass.
+    raw_max = np.array([side_thresholds[category][1] for category in categories[:-1]], dtype=float)
+    raw_max[0] = max(1, raw_max[0])
+    raw_max = np.minimum(100, raw_max)
+    offsets = np.arange(len(raw_max))
+    upper = offsets + np.maximum.accumulate(raw_max - offsets)
+    
+    # Each category starts where the previous one ends; the last one always ends at 100
+    lower = np.concatenate(([0], upper))
+    upper = np.append(upper, 100)
+    
+    # Ensure min < max for the last category by moving the boundary back
+    if lower[-1] >= 100:
+        lower[-1] = upper[-2] = 99
+    
+    adjusted_thresholds = {
+        category: [int(lo), int(hi)]
+        for category, lo, hi in zip(categories, lower, upper)
+    }
+    
+    return adjusted_thresholds
+
+
+def _side_rank_table(side_thresholds: dict, severity_rank: dict, no_category: int, dtype) -> tuple:
+    """
+    Precompile one side's thresholds into a severity-rank lookup table
+    
+    Every category boundary is an edge; within two consecutive edges the matching category
+    (first in dict order with min <= score < max, as in get_category_from_score) is constant,
+    so its severity rank is resolved once per interval.
+    
+    Args:
+        side_thresholds: Dict mapping category -> [min, max]
+        severity_rank: Dict mapping category -> severity rank (0 = most severe)
+        no_category: Rank used where no category matches (sorts after every real rank)
+        dtype: Integer dtype of the table
+        
+    Returns:
+        Tuple of (edges, table): the rank for a score is table[searchsorted(edges, score, 'right')]
+    """
+    ranges = list(side_thresholds.values())
+    ranks = [severity_rank[category] for category in side_thresholds]
+    edges = np.unique(np.array([bound for bounds in ranges for bound in bounds], dtype=float))
+    
+    # table[k + 1] is the rank for scores in [edges[k], edges[k + 1]); below/above all edges -> no category
+    table = np.full(len(edges) + 1, no_category, dtype=dtype)
+    for k in range(len(edges) - 1):
+        for (min_val, max_val), rank in zip(ranges, ranks):
+            if min_val <= edges[k] < max_val:
+                table[k + 1] = rank
+                break
+    
+    return edges, table
+
+
+def _score_arrays(df: pd.DataFrame, score_prefix: str) -> dict:
+    """
+    Float64 score array per side with a score column (NaN = missing or non-numeric)
+    
+    Scores stay float64 so threshold boundaries compare exactly as in get_category_from_score.
+    """
+    return {
+        side: pd.to_numeric(df[f"{score_prefix}{side}_score"], errors='coerce').to_numpy(dtype=float)
+        for side in _SIDES
+        if f"{score_prefix}{side}_score" in df.columns
+    }
+
+
+def _side_rank_matrix(score_arrays: dict, question_thresholds: dict, n_records: int, side_rank_cache: dict = None) -> tuple:
+    """
+    Severity rank of each record's category on every side
+    
+    Args:
+        score_arrays: Side -> score array (see _score_arrays)
+        question_thresholds: Dict mapping side -> category -> [min, max]
+        n_records: Number of records
+        side_rank_cache: Optional dict reused across calls on the same score arrays; per-side
+            rank columns are memoized in it (the optimizer varies one side at a time)
+        
+    Returns:
+        Tuple of (records x sides rank matrix, sides, severity order); rank len(severity order)
+        means no category
+    """
+    severity_order = get_severity_order_from_thresholds(question_thresholds)
+    severity_rank = {category: rank for rank, category in enumerate(severity_order)}
+    no_category = len(severity_order)
+    rank_dtype = np.int8 if no_category < np.iinfo(np.int8).max else np.int16
+    
+    sides = [side for side in _SIDES if side in question_thresholds and side in score_arrays]
+    
+    # Side-major (Fortran) layout: each side's column is contiguous, so the per-record min
+    # across sides runs as elementwise minimums instead of a strided row-by-row reduction
+    ranks = np.empty((n_records, len(sides)), dtype=rank_dtype, order='F')
+    for column, side in enumerate(sides):
+        side_thresholds = question_thresholds[side]
+        cache_key = None
+        if side_rank_cache is not None:
+            # Category order is part of the key (first match wins), as are the categories' ranks
+            cache_key = (side, no_category, tuple(
+                (category, min_val, max_val, severity_rank[category])
+                for category, (min_val, max_val) in side_thresholds.items()
+            ))
+            cached = side_rank_cache.get(cache_key)
+            if cached is not None:
+                ranks[:, column] = cached
+                continue
+        
+        edges, table = _side_rank_table(side_thresholds, severity_rank, no_category, rank_dtype)
+        # NaN sorts past the last edge, so missing scores get no category
+        ranks[:, column] = table[np.searchsorted(edges, score_arrays[side], side='right')]
+        
+        if cache_key is not None:
+            if len(side_rank_cache) >= _SIDE_RANK_CACHE_SIZE:
+                side_rank_cache.clear()
+            side_rank_cache[cache_key] = ranks[:, column].copy()
+    
+    return ranks, sides, severity_order
+
+
+def _severity_winner(score_arrays: dict, question_thresholds: dict, n_records: int, side_rank_cache: dict = None) -> tuple:
+    """
+    Severity rank of the most severe category across each record's sides
+    
+    Args:
+        score_arrays, question_thresholds, n_records, side_rank_cache: See _side_rank_matrix
+        
+    Returns:
+        Tuple of (rank array, severity order); rank len(severity order) means no category
+    """
+    ranks, sides, severity_order = _side_rank_matrix(score_arrays, question_thresholds, n_records, side_rank_cache)
+    if not sides:
+        return np.full(n_records, len(severity_order), dtype=ranks.dtype), severity_order
+    return ranks.min(axis=1), severity_order
+
+
+def _rank_names(winner: np.ndarray, severity_order: list) -> np.ndarray:
+    """Map severity ranks to category names (None for no category)"""
+    names = np.empty(len(severity_order) + 1, dtype=object)
+    names[:len(severity_order)] = severity_order
+    return names[winner]
+
+
+def compute_adjusted_answers(df: pd.DataFrame, question_thresholds: dict, score_prefix: str) -> np.ndarray:
+    """
+    Classify every record with the given thresholds (vectorized version of the per-row loop)
     
-    # Step 1: Ensure first category starts at 0
-    first_category = categories[0]
-    first_min, first_max = side_thresholds[first_category]
-    # Clamp first_max to valid range, but ensure it's at least 1
-    first_max = max(1, min(100, first_max))
-    adjusted_thresholds[first_category] = [0, first_max]
+    Each side's score is mapped to the severity rank of its category; the record's answer is
+    the most severe (lowest rank) category across its sides (severity from
+    get_severity_order_from_thresholds).
     
-    # Step 2: Build continuous thresholds for middle categories
-    # Process from first to second-to-last category
-    for i in range(1, len(categories) - 1):
-        category = categories[i]
-        prev_category = categories[i-1]
+    Args:
+        df: DataFrame of records with {score_prefix}{side}_score columns
+        question_thresholds: Dict mapping side -> category -> [min, max]
+        score_prefix: "" for the deployed model, "new_" for the new model
         
-        # Previous category's max becomes this category's min
-        prev_min, prev_max = adjusted_thresholds[prev_category]
-        adjusted_min = prev_max
+    Returns:
+        Object array of category names (None where no side has a category)
+    """
+    winner, severity_order = _severity_winner(_score_arrays(df, score_prefix), question_thresholds, len(df))
+    return _rank_names(winner, severity_order)
+
+
+def _score_range_mask(df: pd.DataFrame, sides: list, score_prefix: str, score_min: float, score_max: float) -> np.ndarray:
+    """
+    Boolean mask of records where any of the given sides has a score within [score_min, score_max]
+    
+    Args:
+        df: Records DataFrame
+        sides: Sides to check (e.g. ['top', 'left'])
+        score_prefix: "" for deployed model scores, "new_" for new model scores
+        score_min: Lower bound (inclusive)
+        score_max: Upper bound (inclusive)
         
-        # Use original max from user's input, but ensure it's valid
-        original_min, original_max = side_thresholds[category]
-        # Adjusted max should be at least min + 1, and at most 100
-        # We'll let the last category handle the final adjustment
-        adjusted_max = max(adjusted_min + 1, min(100, original_max))
+    Returns:
+        NumPy boolean array aligned with df
+    """
+    score_cols = [f"{score_prefix}{side}_score" for side in sides if f"{score_prefix}{side}_score" in df.columns]
+    if not score_cols:
+        return np.zeros(len(df), dtype=bool)
+    # Preallocated float32 matrix: scores are 0-100 with at most 2 decimals and the slider bounds
+    # are whole numbers, so float32 rounding can't move a score across a bound
+    scores = np.empty((len(df), len(score_cols)), dtype=np.float32, order='F')
+    for column, col in enumerate(score_cols):
+        # Missing, blank and non-numeric scores become NaN and never match
+        scores[:, column] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float32)
+    return ((scores >= score_min) & (scores <= score_max)).any(axis=1)
+
+
+def _clone_thresholds(obj):
+    """Copy a JSON-shaped threshold payload (dicts of dicts of [min, max] lists) without deepcopy overhead"""
+    if isinstance(obj, dict):
+        return {key: _clone_thresholds(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_clone_thresholds(item) for item in obj]
+    return obj
+
+
+def _json_loads(s):
+    """Parse a JSON string (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def _json_digest(obj) -> str:
+    """Short blake2b hex digest of a JSON-serializable payload (hashes orjson bytes directly when available)"""
+    payload = orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _reference_matrix_key(data: dict, original_thresholds: dict, question_name: str, model: str) -> str:
+    """Key identifying the reference matrix: dataset, model and the original thresholds of the question"""
+    # Threshold keys are not sorted - category order decides the matrix label order
+    return _json_digest([
+        data.get("folder_name", "") if isinstance(data, dict) else "",
+        len(data.get("data", [])) if isinstance(data, dict) else len(data or []),
+        question_name,
+        model,
+        original_thresholds.get(question_name, {}),
+    ])
+
+
+def _resolve_question_name(data, threshold_config: dict):
+    """
+    Determine the question being tweaked
+    
+    Args:
+        data: Data store payload (question_name is set during report generation)
+        threshold_config: Threshold configuration, scanned for a physical condition question as fallback
         
-        adjusted_thresholds[category] = [int(adjusted_min), int(adjusted_max)]
+    Returns:
+        Question name, or None if none can be determined
+    """
+    if isinstance(data, dict) and data.get('question_name'):
+        return data['question_name']
     
-    # Step 3: Ensure last category ends at 100
-    last_category = categories[-1]
-    prev_category = categories[-2]
+    for key in threshold_config or {}:
+        if 'physicalcondition' in key.lower():
+            return key
+    return None
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping, shared by all sessions of this process"""
     
-    # Previous category's max becomes this category's min
-    prev_min, prev_max = adjusted_thresholds[prev_category]
-    adjusted_min = prev_max
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
     
-    # Last category must end at 100
-    adjusted_max = 100
+    def get(self, key):
+        """Return the cached value for key (marking it recently used), or None"""
+        if key is None:
+            return None
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
     
-    # Ensure min < max
-    if adjusted_min >= adjusted_max:
-        # If previous category's max is >= 100, we need to adjust it
-        # Move the boundary back
-        adjusted_min = max(0, 99)
-        adjusted_thresholds[prev_category] = [adjusted_thresholds[prev_category][0], int(adjusted_min)]
+    def put(self, key, value):
+        """Store value, evicting the least recently used entries when full"""
+        if key is None:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+# Recently computed tweaker matrices, the DataFrames of the last loaded datasets, the
+# reference matrices (data and plot), which don't change while sliders are moved, the
+# changed-records lists behind the paginated changed records view, and optimizer results
+_matrix_cache = _LRUCache(8)
+_frame_cache = _LRUCache(2)
+_reference_cache = _LRUCache(4)
+_reference_plot_cache = _LRUCache(4)
+_answer_status_cache = _LRUCache(8)
+_changed_records_cache = _LRUCache(4)
+_optimization_cache = _LRUCache(8)
+
+
+def _data_key(data):
+    """Key of the loaded dataset (stamped by report generation), or None if not cacheable"""
+    return (data.get("data_key") or None) if isinstance(data, dict) else None
+
+
+def _matrix_cache_key(data, original_thresholds: dict, adjusted_thresholds: dict, question_name: str, model: str):
+    """
+    Digest identifying one matrix recalculation (also kept client-side as the signature
+    of the rendered matrices)
+    
+    Returns:
+        blake2b hex digest, or None when the dataset has no data_key (not cacheable)
+    """
+    data_key = _data_key(data)
+    if not data_key:
+        return None
+    # Category order matters for classification, so threshold keys are not sorted
+    return _json_digest([
+        data_key,
+        question_name,
+        model,
+        original_thresholds.get(question_name, {}),
+        adjusted_thresholds.get(question_name, {}),
+    ])
+
+
+def _reference_cache_key(data, ref_key: str):
+    """Cache key of a reference matrix: dataset plus _reference_matrix_key, or None if not cacheable"""
+    data_key = _data_key(data)
+    return (data_key, ref_key) if data_key else None
+
+
+def _answer_column_status(data, df: pd.DataFrame, answer_col: str) -> str:
+    """
+    Check that the model's answer column is usable, cached per dataset
     
-    adjusted_thresholds[last_category] = [int(adjusted_min), 100]
+    Returns:
+        "ok", "missing_col" or "all_empty"
+    """
+    data_key = _data_key(data)
+    cache_key = (data_key, answer_col) if data_key else None
+    status = _answer_status_cache.get(cache_key)
+    if status is None:
+        if answer_col not in df.columns:
+            status = "missing_col"
+        elif df[answer_col].isna().all() or (df[answer_col].astype(str).str.strip() == '').all():
+            status = "all_empty"
+        else:
+            status = "ok"
+        _answer_status_cache.put(cache_key, status)
+    return status
+
+
+def _records_frame(data, records: list) -> pd.DataFrame:
+    """
+    DataFrame of the data store records, cached per dataset
     
-    return adjusted_thresholds
+    The returned frame is shared between calls and must not be modified in place.
+    """
+    data_key = _data_key(data)
+    df = _frame_cache.get(data_key)
+    if df is None:
+        df = pd.DataFrame(records)
+        _frame_cache.put(data_key, df)
+    return df
+
+
+def _changed_records(data, records: list, adjusted_thresholds: dict, threshold_config: dict, question_name: str, model: str) -> list:
+    """
+    Records whose answer changes under the adjusted thresholds, as display records, cached per
+    dataset and thresholds (pagination, filters and image toggles re-render without recomputing)
+    
+    Args:
+        data: Data store payload (its data_key identifies the dataset)
+        records: Data store records
+        adjusted_thresholds: Adjusted threshold configuration
+        threshold_config: Original threshold configuration (decides the least severe category)
+        question_name: Question name
+        model: "old" or "new"
+        
+    Returns:
+        List of record dicts; shared between calls, so it must not be modified
+    """
+    data_key = _data_key(data)
+    cache_key = _json_digest([
+        data_key,
+        question_name,
+        model,
+        adjusted_thresholds.get(question_name, {}),
+        threshold_config.get(question_name, threshold_config.get("default", {})),
+    ]) if data_key else None
+    changed_records = _changed_records_cache.get(cache_key)
+    if changed_records is not None:
+        return changed_records
+    
+    # Determine which answer column to use
+    if model == "new":
+        original_answer_col = "new_cscan_answer"
+        adjusted_answer_col = "adjusted_new_cscan_answer"
+        score_prefix = "new_"
+    else:
+        original_answer_col = "cscan_answer"
+        adjusted_answer_col = "adjusted_cscan_answer"
+        score_prefix = ""
+    
+    # Recalculate adjusted answers (vectorized, as in the matrices); new columns go on a shallow copy
+    df = _records_frame(data, records).copy(deep=False)
+    question_thresholds = adjusted_thresholds.get(question_name, {})
+    score_arrays = _score_arrays(df, score_prefix)
+    ranks, rank_sides, severity_order = _side_rank_matrix(score_arrays, question_thresholds, len(df))
+    no_category = len(severity_order)
+    winner = ranks.min(axis=1) if rank_sides else np.full(len(df), no_category, dtype=ranks.dtype)
+    adjusted_answers = _rank_names(winner, severity_order)
+    
+    # Changed records: a non-empty original answer that differs from the adjusted one. Original
+    # answers are compared as category codes mapped to severity ranks (one lookup per distinct
+    # answer): -1 for answers that are no category of the thresholds, -2 for missing or blank ones
+    original_answers = df[original_answer_col].astype('category')
+    severity_rank = {category: rank for rank, category in enumerate(severity_order)}
+    category_ranks = np.array([
+        severity_rank.get(answer, -1) if str(answer).strip() else -2
+        for answer in original_answers.cat.categories
+    ] + [-2], dtype=np.int16)  # the extra slot is indexed by code -1 (missing)
+    original_ranks = category_ranks[original_answers.cat.codes.to_numpy()]
+    changed_positions = np.flatnonzero((original_ranks != -2) & (original_ranks != winner))
+    
+    # Adjusted contributing sides (sides whose category is the adjusted answer) - only needed for
+    # changed records, and never reported for the least severe category
+    adjusted_contrib_col = f"adjusted_{score_prefix}contributing_sides" if score_prefix else "adjusted_contributing_sides"
+    contributes = ranks == winner[:, None]
+    least_severe_ranks = {
+        rank for rank, category in enumerate(severity_order)
+        if is_least_severe_category(category, question_name, threshold_config)
+    }
+    shown_positions = changed_positions[
+        (winner[changed_positions] != no_category)
+        & ~np.isin(winner[changed_positions], list(least_severe_ranks))
+    ]
+    
+    # Contributing scores ("side: 12.34") are formatted for all shown rows at once; a side only
+    # contributes when its score is numeric, so every picked label has a formatted score
+    side_names = np.array(rank_sides, dtype=object)
+    score_labels = np.full((len(shown_positions), len(rank_sides)), '', dtype=object)
+    if rank_sides and len(shown_positions):
+        shown_scores = np.column_stack([score_arrays[side] for side in rank_sides])[shown_positions]
+        score_labels = np.char.add(
+            np.array([f"{side}: " for side in rank_sides]),
+            np.char.mod('%.2f', shown_scores)
+        ).astype(object)
+    
+    adjusted_contributing_sides = np.full(len(df), None, dtype=object)
+    contributing_scores = {}
+    for row, position in enumerate(shown_positions):
+        hits = contributes[position]
+        adjusted_contributing_sides[position] = ', '.join(side_names[hits])
+        contributing_scores[position] = ', '.join(score_labels[row][hits])
+    
+    df[adjusted_answer_col] = adjusted_answers
+    df[adjusted_contrib_col] = adjusted_contributing_sides
+    
+    # Build display records for the changed rows only
+    changed_records = []
+    for position, record_dict in zip(changed_positions, df.iloc[changed_positions].to_dict('records')):
+        original = record_dict[original_answer_col]
+        adjusted = record_dict[adjusted_answer_col]
+        record_dict['original_answer'] = original
+        record_dict['adjusted_answer'] = adjusted
+        
+        # Get adjusted contributing sides
+        adjusted_contrib_sides_str = record_dict.get(adjusted_contrib_col, '') or None
+        
+        # Update the answer column with adjusted value so table shows it
+        record_dict[original_answer_col] = adjusted
+        
+        # Update the contributing sides column with adjusted value so table shows it
+        if score_prefix:
+            # For new model
+            record_dict['new_contributing_sides'] = adjusted_contrib_sides_str if adjusted_contrib_sides_str else (record_dict.get('new_contributing_sides', '') or '')
+        else:
+            # For deployed model
+            record_dict['contributing_sides'] = adjusted_contrib_sides_str if adjusted_contrib_sides_str else (record_dict.get('contributing_sides', '') or '')
+        
+        # Add contributing sides scores (only for sides that contributed to the adjusted answer)
+        record_dict['contributing_scores'] = contributing_scores.get(position, "N/A")
+        
+        changed_records.append(record_dict)
+    
+    _changed_records_cache.put(cache_key, changed_records)
+    return changed_records
+
+
+def _filtered_changed_records(store: dict) -> list:
+    """Resolve the filtered records of a tweaker-changed-records-store payload.
+    
+    The store carries the records once ("data"); the filter result is kept as row
+    positions into them ("filtered_index", None when no filter applies).
+    
+    Args:
+        store: tweaker-changed-records-store data
+    
+    Returns:
+        List of filtered record dicts
+    """
+    records = store.get("data", [])
+    filtered_index = store.get("filtered_index")
+    if filtered_index is None:
+        return records
+    return [records[i] for i in filtered_index]
+
+
+@lru_cache(maxsize=32)
+def _parse_id(id_str: str) -> dict:
+    """Parse a pattern-matching component ID string (only a handful of distinct IDs exist)"""
+    return _json_loads(id_str)
+
+
+def _build_threshold_sliders(threshold_config: dict, adjusted_thresholds: dict, data, selected_side: str):
+    """
+    Build the threshold sliders of every side (only the selected side's group is visible)
+    
+    Args:
+        threshold_config: Original threshold configuration
+        adjusted_thresholds: Current adjusted thresholds (used for slider values when available)
+        data: Data store payload (for the question name)
+        selected_side: Side whose slider group is shown
+        
+    Returns:
+        Slider groups container, or a message when there is nothing to show
+    """
+    if not threshold_config:
+        return html.Div("No threshold configuration loaded", className="text-muted")
+    
+    # Determine question name - prioritize question_name from data-store (set during report generation)
+    question_name = _resolve_question_name(data, threshold_config)
+    
+    if not question_name:
+        return html.Div("No question configuration found", className="text-muted")
+    
+    # Use adjusted thresholds if available, otherwise use original
+    if adjusted_thresholds and question_name in adjusted_thresholds:
+        question_thresholds = adjusted_thresholds[question_name]
+    else:
+        question_thresholds = threshold_config.get(question_name, {})
+    
+    side_groups = []
+    for side in _SIDES:
+        if side not in question_thresholds:
+            sliders = [html.Div(f"No thresholds available for {side} side", className="text-muted")]
+        else:
+            sliders = []
+            for category, (min_val, max_val) in question_thresholds[side].items():
+                slider_group = dbc.Card([
+                    dbc.CardBody([
+                        html.Div([
+                            html.Span(category, className="fw-bold", style={"fontSize": "1.1em", "color": "#1e40af"}),
+                            html.Span(id={"type": "tweaker-value-display", "side": side, "category": category},
+                                     children=f" [{int(min_val)}, {int(max_val)}]",
+                                     className="ms-2", style={"color": "#3b82f6", "fontWeight": "600"})
+                        ], className="mb-3"),
+                        
+                        dcc.RangeSlider(
+                            id={"type": "threshold-range-slider", "side": side, "category": category},
+                            min=0,
+                            max=100,
+                            step=1,
+                            value=[int(min_val), int(max_val)],
+                            marks=_STD_MARKS,
+                            tooltip={"placement": "bottom", "always_visible": False}
+                        )
+                    ])
+                ], className="mb-3")
+                
+                sliders.append(slider_group)
+        
+        side_groups.append(html.Div(
+            sliders,
+            id={"type": "tweaker-side-group", "side": side},
+            style={"display": "block" if side == selected_side else "none"}
+        ))
+    
+    return html.Div(side_groups)
+
+
+# Static navigation button columns of the changed records pagination, built once and shared by
+# every render (Dash only serializes them, never mutates them)
+_TWEAKER_PAGER_BACK = dbc.Col([
+    dbc.ButtonGroup([
+        dbc.Button("⏮️ First Page", id="tweaker-first-btn", color="primary", outline=True, size="sm"),
+        dbc.Button("◀️ Prev", id="tweaker-prev-btn", color="primary", outline=True, size="sm"),
+    ])
+], md=4, className="d-flex justify-content-start")
+_TWEAKER_PAGER_FORWARD = dbc.Col([
+    dbc.ButtonGroup([
+        dbc.Button("Next ▶️", id="tweaker-next-btn", color="primary", outline=True, size="sm"),
+        dbc.Button("Last Page ⏭️", id="tweaker-last-btn", color="primary", outline=True, size="sm"),
+    ])
+], md=4, className="d-flex justify-content-end")
+
+
+def _build_changed_records_display(changed_records: list, records_to_display: list, current_page: int, model: str, image_toggle_states: dict):
+    """
+    Build the changed records view (stats bar, the current page's record table and pagination)
+    in one pass; page bounds and counts are computed once and shared by all three
+    
+    Args:
+        changed_records: All changed records
+        records_to_display: Filtered changed records (non-empty)
+        current_page: Requested page (clamped to the last page)
+        model: "old" or "new"
+        image_toggle_states: Image toggle states per record
+        
+    Returns:
+        Changed records display
+    """
+    from components.image_viewer import create_accordion_view
+    
+    n_changed = len(changed_records)
+    n_filtered = len(records_to_display)
+    total_pages = (n_filtered + TWEAKER_RECORDS_PER_PAGE - 1) // TWEAKER_RECORDS_PER_PAGE
+    current_page = min(current_page, max(0, total_pages - 1))
+    start_idx = current_page * TWEAKER_RECORDS_PER_PAGE
+    end_idx = min(start_idx + TWEAKER_RECORDS_PER_PAGE, n_filtered)
+    value_style = {"color": "#3b82f6", "fontSize": "1.2em"}
+    counter_style = {"fontSize": "1.2em", "fontWeight": "600", "color": "#3b82f6"}
+    
+    # Stats bar matching image viewer style
+    stats_bar = dbc.Card([
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    html.Span("Total Records:", className="label fw-bold me-2"),
+                    html.Span(str(n_changed), id="tweaker-total-records", className="value", style=value_style),
+                ], md=2),
+                dbc.Col([
+                    html.Span("Filtered:", className="label fw-bold me-2"),
+                    html.Span(str(n_filtered), id="tweaker-filtered-records", className="value", style=value_style),
+                ], md=2),
+                dbc.Col([
+                    html.Span("Model:", className="label fw-bold me-2"),
+                    html.Span("New Model" if model == "new" else "Deployed Model", className="value", style=value_style),
+                ], md=3),
+            ])
+        ])
+    ], className="mb-4")
+    
+    # Use create_accordion_view for consistent UI with image viewer (renders the current page only)
+    accordion_view = create_accordion_view(
+        records_to_display,  # Use filtered records for display
+        current_page,
+        image_toggle_states,  # Use image toggle states from store
+        {},  # Audit tags
+        []   # Audit options
+    )
+    
+    # Pagination controls matching image viewer (only the record counters change between renders)
+    pagination = dbc.Card([
+        dbc.CardBody([
+            dbc.Row([
+                _TWEAKER_PAGER_BACK,
+                dbc.Col([
+                    html.Div([
+                        html.Span("Records ", style={"fontSize": "0.9em"}),
+                        html.Span(id="tweaker-page-start", children=str(start_idx + 1), style=counter_style),
+                        html.Span("-", style={"margin": "0 4px"}),
+                        html.Span(id="tweaker-page-end", children=str(end_idx), style=counter_style),
+                        html.Span(" of ", style={"margin": "0 8px"}),
+                        html.Span(id="tweaker-total-filtered", children=str(n_filtered), style={"fontSize": "1.2em", "fontWeight": "600"}),
+                    ], className="text-center", style={"lineHeight": "38px"})
+                ], md=4),
+                _TWEAKER_PAGER_FORWARD,
+            ])
+        ])
+    ], className="mt-4")
+    
+    return html.Div([stats_bar, accordion_view, pagination])
 
 
 def create_threshold_tweaker_tab():
@@ -325,8 +991,11 @@ def create_threshold_tweaker_tab():
                     dbc.Button("Front", id={"type": "tweaker-side-selector", "side": "front"}, outline=True, color="primary", size="sm"),
                 ], className="mb-4"),
                 
-                # Threshold Sliders
-                html.Div(id="threshold-sliders")
+                # Threshold Sliders (filled once the matrices initialize the adjusted thresholds)
+                html.Div(
+                    html.Div("Please load data from the Report Generation tab", className="text-muted"),
+                    id="threshold-sliders"
+                )
             ])
         ], className="mb-4 shadow-sm"),
         
@@ -374,15 +1043,7 @@ def create_threshold_tweaker_tab():
                         dbc.Label("Contributing Sides", html_for="tweaker-contributing-side-filter", className="fw-bold"),
                         dcc.Dropdown(
                             id="tweaker-contributing-side-filter",
-                            options=[
-                                {"label": "Top", "value": "top"},
-                                {"label": "Bottom", "value": "bottom"},
-                                {"label": "Left", "value": "left"},
-                                {"label": "Right", "value": "right"},
-                                {"label": "Back", "value": "back"},
-                                {"label": "Front", "value": "front"},
-                                {"label": "Blank", "value": "_blank_"}
-                            ],
+                            options=SIDE_OPTIONS_WITH_BLANK,
                             value=[],
                             placeholder="All sides (filter off)",
                             clearable=True,
@@ -393,15 +1054,7 @@ def create_threshold_tweaker_tab():
                         dbc.Label("New Contributing Sides", html_for="tweaker-new-contributing-side-filter", className="fw-bold"),
                         dcc.Dropdown(
                             id="tweaker-new-contributing-side-filter",
-                            options=[
-                                {"label": "Top", "value": "top"},
-                                {"label": "Bottom", "value": "bottom"},
-                                {"label": "Left", "value": "left"},
-                                {"label": "Right", "value": "right"},
-                                {"label": "Back", "value": "back"},
-                                {"label": "Front", "value": "front"},
-                                {"label": "Blank", "value": "_blank_"}
-                            ],
+                            options=SIDE_OPTIONS_WITH_BLANK,
                             value=[],
                             placeholder="All sides (filter off)",
                             clearable=True,
@@ -418,19 +1071,12 @@ def create_threshold_tweaker_tab():
                             max=100,
                             step=0.1,
                             value=[0, 100],
-                            marks={i: str(i) for i in range(0, 101, 20)},
+                            marks=_STD_MARKS,
                             tooltip={"placement": "bottom", "always_visible": False}
                         ),
                         dcc.Dropdown(
                             id="tweaker-deployed-side-score-filter",
-                            options=[
-                                {"label": "Top", "value": "top"},
-                                {"label": "Bottom", "value": "bottom"},
-                                {"label": "Left", "value": "left"},
-                                {"label": "Right", "value": "right"},
-                                {"label": "Back", "value": "back"},
-                                {"label": "Front", "value": "front"}
-                            ],
+                            options=SIDE_OPTIONS,
                             value=[],
                             placeholder="All sides (filter off)",
                             clearable=True,
@@ -445,19 +1091,12 @@ def create_threshold_tweaker_tab():
                             max=100,
                             step=0.1,
                             value=[0, 100],
-                            marks={i: str(i) for i in range(0, 101, 20)},
+                            marks=_STD_MARKS,
                             tooltip={"placement": "bottom", "always_visible": False}
                         ),
                         dcc.Dropdown(
                             id="tweaker-new-side-score-filter",
-                            options=[
-                                {"label": "Top", "value": "top"},
-                                {"label": "Bottom", "value": "bottom"},
-                                {"label": "Left", "value": "left"},
-                                {"label": "Right", "value": "right"},
-                                {"label": "Back", "value": "back"},
-                                {"label": "Front", "value": "front"}
-                            ],
+                            options=SIDE_OPTIONS,
                             value=[],
                             placeholder="All sides (filter off)",
                             clearable=True,
@@ -491,24 +1130,14 @@ def create_threshold_tweaker_tab():
 def register_threshold_tweaker_callbacks(app):
     """Register callbacks for threshold tweaker tab"""
     
-    # Show loading indicator when optimization buttons are clicked
-    @app.callback(
+    # Show loading indicator when optimization buttons are clicked (clientside, see assets/tweaker.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="showOptimizationLoader"),
         Output("optimization-loading", "style", allow_duplicate=True),
         [Input("optimize-all-thresholds-btn", "n_clicks"),
          Input("optimize-selected-side-btn", "n_clicks")],
         prevent_initial_call=True
     )
-    def show_optimization_loader(optimize_all_clicks, optimize_side_clicks):
-        """Show loading indicator immediately when optimization button is clicked"""
-        ctx = callback_context
-        if not ctx.triggered:
-            return {"display": "none"}
-        
-        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-        if trigger_id in ["optimize-all-thresholds-btn", "optimize-selected-side-btn"]:
-            return {"display": "flex", "alignItems": "center", "gap": "10px"}
-        
-        return {"display": "none"}
     
     # Model toggle - handle clicks (only updates model store, button states handled by initialize callback)
     @app.callback(
@@ -530,66 +1159,17 @@ def register_threshold_tweaker_callbacks(app):
         else:
             return "new"
     
-    # Update model toggle button states based on model store
-    @app.callback(
+    # Update model toggle button states based on model store (clientside, see assets/tweaker.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="toggleModel"),
         [Output("tweaker-old-model-btn", "active", allow_duplicate=True),
          Output("tweaker-old-model-btn", "style", allow_duplicate=True),
          Output("tweaker-new-model-btn", "active", allow_duplicate=True),
          Output("tweaker-new-model-btn", "style", allow_duplicate=True)],
-        [Input("tweaker-model-store", "data"),
-         Input("main-tabs", "active_tab")],
+        Input("tweaker-model-store", "data"),
+        State("main-tabs", "active_tab"),
         prevent_initial_call='initial_duplicate'
     )
-    def update_model_toggle_buttons(model, active_tab):
-        """Update model toggle button states based on model store value"""
-        # Only update when on tweaker tab
-        if active_tab != "tweaker":
-            return no_update, no_update, no_update, no_update
-        
-        # Normalize model value
-        if not model:
-            model = "old"  # Default to deployed model
-        elif model not in ["old", "new"]:
-            model = "old"  # Default to deployed model if invalid
-        
-        if model == "old":
-            old_style = {
-                "backgroundColor": "#1e40af",
-                "borderColor": "#1e40af",
-                "color": "white",
-                "fontWeight": "700",
-                "boxShadow": "0 4px 12px rgba(30, 64, 175, 0.4)",
-                "transition": "all 0.3s ease",
-                "whiteSpace": "nowrap"
-            }
-            new_style = {
-                "backgroundColor": "white",
-                "borderColor": "white",
-                "color": "#1e40af",
-                "fontWeight": "600",
-                "transition": "all 0.3s ease",
-                "whiteSpace": "nowrap"
-            }
-            return True, old_style, False, new_style
-        else:
-            old_style = {
-                "backgroundColor": "white",
-                "borderColor": "white",
-                "color": "#1e40af",
-                "fontWeight": "600",
-                "transition": "all 0.3s ease",
-                "whiteSpace": "nowrap"
-            }
-            new_style = {
-                "backgroundColor": "#1e40af",
-                "borderColor": "#1e40af",
-                "color": "white",
-                "fontWeight": "700",
-                "boxShadow": "0 4px 12px rgba(30, 64, 175, 0.4)",
-                "transition": "all 0.3s ease",
-                "whiteSpace": "nowrap"
-            }
-            return False, old_style, True, new_style
     
     # Side selector
     @app.callback(
@@ -606,8 +1186,7 @@ def register_threshold_tweaker_callbacks(app):
             return current_side, [False] * len(n_clicks_list)
         
         trigger = ctx.triggered[0]['prop_id']
-        import json
-        trigger_dict = json.loads(trigger.split('.')[0])
+        trigger_dict = _parse_id(trigger.rsplit('.', 1)[0])
         selected_side = trigger_dict.get('side')
         
         # Create active states for all buttons
@@ -630,27 +1209,27 @@ def register_threshold_tweaker_callbacks(app):
          Output("impact-original", "children", allow_duplicate=True),
          Output("tweaker-ref-matrix-header", "children", allow_duplicate=True),
          Output("tweaker-adj-matrix-header", "children", allow_duplicate=True),
-         Output("adjusted-thresholds-store", "data", allow_duplicate=True)],
+         Output("adjusted-thresholds-store", "data", allow_duplicate=True),
+         Output("tweaker-ref-matrix-cache", "data", allow_duplicate=True),
+         Output("tweaker-matrix-signature-store", "data", allow_duplicate=True),
+         Output("threshold-sliders", "children", allow_duplicate=True)],
         [Input("main-tabs", "active_tab"),
          Input("data-store", "data"),
          Input("threshold-config-store", "data")],
         [State("tweaker-model-store", "data"),
-         State("adjusted-thresholds-store", "data")],
+         State("adjusted-thresholds-store", "data"),
+         State("tweaker-current-side-store", "data")],
         prevent_initial_call='initial_duplicate'
     )
-    def initialize_tweaker_matrices(active_tab, data, threshold_config, model, adjusted_thresholds):
+    def initialize_tweaker_matrices(active_tab, data, threshold_config, model, adjusted_thresholds, selected_side):
         """Initialize matrices when data is first loaded and tweaker tab is active"""
         
         # Only initialize if we're on the tweaker tab - check this FIRST
         if active_tab != "tweaker":
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
         
         if not threshold_config or not data:
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
-        
-        # Initialize adjusted thresholds to original if not set
-        if not adjusted_thresholds:
-            adjusted_thresholds = copy.deepcopy(threshold_config)
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
         
         # Normalize model value FIRST - handle None and ensure it's either "old" or "new"
         # This ensures we use the correct model from the start
@@ -660,105 +1239,64 @@ def register_threshold_tweaker_callbacks(app):
             model = "old"  # Default to deployed model if invalid value
         
         # Determine question name - prioritize question_name from data-store (set during report generation)
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
+        question_name = _resolve_question_name(data, threshold_config)
         
-        # Fallback: detect from threshold_config if not in data-store
         if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
         
-        if not question_name:
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update
+        # Initialize adjusted thresholds to original if not set (only once we know there is something to show)
+        if not adjusted_thresholds:
+            adjusted_thresholds = _clone_thresholds(threshold_config)
         
         # Determine model name for headers
-        model_name = "Deployed Model" if model == "old" else "New Model"
-        ref_header = f"{model_name} (Reference Matrix)"
-        adj_header = f"{model_name} (Adjusted Matrix)"
+        ref_header, adj_header = _MATRIX_HEADERS[model]
         
-        # Recalculate and return matrices
-        results = recalculate_and_update_matrices(
+        # Recalculate and return matrices (the tab was just rendered or the data changed, so always send the reference figure)
+        results, ref_matrix_key = recalculate_and_update_matrices(
             data, threshold_config, adjusted_thresholds, question_name, model
         )
         
-        # Return results plus headers and adjusted_thresholds
-        return results + (ref_header, adj_header, adjusted_thresholds,)
+        # The tab (and its slider container) was just rendered or the data changed - build the sliders here too
+        sliders = _build_threshold_sliders(threshold_config, adjusted_thresholds, data, selected_side)
+        
+        # Return results plus headers, adjusted_thresholds, the rendered reference matrix key, matrix signature and sliders
+        matrix_signature = _matrix_cache_key(data, threshold_config, adjusted_thresholds, question_name, model)
+        return results + (ref_header, adj_header, adjusted_thresholds, ref_matrix_key, matrix_signature, sliders,)
     
-    # Load threshold inputs for selected side
+    # Load threshold inputs for every side (only the selected side's group is visible).
+    # Value changes don't rebuild the sliders - they are patched clientside (see patchSliderValues)
     @app.callback(
         Output("threshold-sliders", "children"),
-        [Input("tweaker-current-side-store", "data"),
-         Input("threshold-config-store", "data"),
-         Input("tweaker-model-store", "data"),
-         Input("adjusted-thresholds-store", "data")],
-        [State("data-store", "data")],
-        prevent_initial_call=False
+        [Input("threshold-config-store", "data"),
+         Input("tweaker-model-store", "data")],
+        [State("adjusted-thresholds-store", "data"),
+         State("data-store", "data"),
+         State("tweaker-current-side-store", "data")],
+        prevent_initial_call=True  # Layout shows the empty state; tab load fills it via initialize_tweaker_matrices
+    )
+    def load_threshold_sliders(threshold_config, model, adjusted_thresholds, data, selected_side):
+        """Load threshold sliders for all sides; switching sides only toggles group visibility"""
+        return _build_threshold_sliders(threshold_config, adjusted_thresholds, data, selected_side)
+    
+    # Move slider handles when the adjusted thresholds change (reset, optimize, validation)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="patchSliderValues"),
+        Output({"type": "threshold-range-slider", "side": ALL, "category": ALL}, "value", allow_duplicate=True),
+        Input("adjusted-thresholds-store", "data"),
+        [State({"type": "threshold-range-slider", "side": ALL, "category": ALL}, "id"),
+         State({"type": "threshold-range-slider", "side": ALL, "category": ALL}, "value"),
+         State("threshold-config-store", "data"),
+         State("data-store", "data")],
+        prevent_initial_call=True
+    )
+    
+    # Show only the selected side's slider group (clientside, see assets/tweaker.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="showSideGroup"),
+        Output({"type": "tweaker-side-group", "side": ALL}, "style"),
+        Input("tweaker-current-side-store", "data"),
+        State({"type": "tweaker-side-group", "side": ALL}, "id")
     )
-    def load_threshold_sliders(selected_side, threshold_config, model, adjusted_thresholds, data):
-        """Load threshold input boxes for the selected side"""
-        
-        if not threshold_config:
-            return html.Div("No threshold configuration loaded", className="text-muted")
-        
-        # Determine question name - prioritize question_name from data-store (set during report generation)
-        # This ensures we use the correct question that was selected when generating the report
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
-        
-        # Fallback: detect from threshold_config if not in data-store
-        if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
-        
-        if not question_name:
-            return html.Div("No question configuration found", className="text-muted")
-        
-        # Use adjusted thresholds if available, otherwise use original
-        if adjusted_thresholds and question_name in adjusted_thresholds:
-            question_thresholds = adjusted_thresholds[question_name]
-        else:
-            question_thresholds = threshold_config.get(question_name, {})
-        
-        if selected_side not in question_thresholds:
-            return html.Div(f"No thresholds available for {selected_side} side", className="text-muted")
-        
-        side_thresholds = question_thresholds[selected_side]
-        categories = list(side_thresholds.keys())
-        
-        sliders = []
-        for category in categories:
-            min_val, max_val = side_thresholds[category]
-            
-            slider_group = dbc.Card([
-                dbc.CardBody([
-                    html.Div([
-                        html.Span(category, className="fw-bold", style={"fontSize": "1.1em", "color": "#1e40af"}),
-                        html.Span(id={"type": "tweaker-value-display", "side": selected_side, "category": category},
-                                 children=f" [{int(min_val)}, {int(max_val)}]",
-                                 className="ms-2", style={"color": "#3b82f6", "fontWeight": "600"})
-                    ], className="mb-3"),
-                    
-                    dcc.RangeSlider(
-                        id={"type": "threshold-range-slider", "side": selected_side, "category": category},
-                                min=0,
-                                max=100,
-                                step=1,
-                        value=[int(min_val), int(max_val)],
-                        marks={i: str(i) for i in range(0, 101, 20)},
-                        tooltip={"placement": "bottom", "always_visible": False}
-                    )
-                ])
-            ], className="mb-3")
-            
-            sliders.append(slider_group)
-        
-        return html.Div(sliders)
     
     # Update threshold values from range sliders
     @app.callback(
@@ -782,34 +1320,53 @@ def register_threshold_tweaker_callbacks(app):
             return no_update
         
         # Determine question name - prioritize question_name from data-store (set during report generation)
-        # This ensures we use the correct question that was selected when generating the report
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
-        
-        # Fallback: detect from threshold_config if not in data-store
-        if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
+        question_name = _resolve_question_name(data, threshold_config)
         
         if not question_name:
             return no_update
         
-        # Initialize adjusted thresholds if needed
-        if not adjusted_thresholds:
-            adjusted_thresholds = copy.deepcopy(threshold_config)
-        elif question_name not in adjusted_thresholds:
-            adjusted_thresholds = copy.deepcopy(threshold_config)
+        # Initialize adjusted thresholds if needed - the copy is shallow: untouched questions,
+        # sides and [min, max] lists are shared, and only the sides written below are cloned
+        if not adjusted_thresholds or question_name not in adjusted_thresholds:
+            source_thresholds = threshold_config
+        else:
+            source_thresholds = adjusted_thresholds
+        adjusted_thresholds = dict(source_thresholds)
         
         # Update thresholds based on slider IDs and values
-        question_thresholds = adjusted_thresholds.get(question_name, {})
+        question_thresholds = dict(source_thresholds.get(question_name, {}))
+        if question_name in adjusted_thresholds:
+            adjusted_thresholds[question_name] = question_thresholds
+        
+        # Only the side whose slider moved is updated (all sides' sliders are mounted)
+        triggered_sides = set()
+        for trigger in callback_context.triggered:
+            prop_id = trigger['prop_id'].rsplit('.', 1)[0]
+            if prop_id.startswith('{'):
+                triggered_sides.add(_parse_id(prop_id).get('side'))
+        
+        # Skip sides whose sliders already show the stored thresholds (e.g. values set by the
+        # clientside patch), so exact thresholds aren't overwritten with the slider integers
+        source_question = source_thresholds.get(question_name, {})
+        changed_sides = set()
+        for slider_id, slider_value in zip(slider_ids, slider_values):
+            side = slider_id.get('side')
+            if side not in triggered_sides:
+                continue
+            current = source_question.get(side, {}).get(slider_id.get('category'))
+            if not current or slider_value != [int(current[0]), int(current[1])]:
+                changed_sides.add(side)
+        triggered_sides = changed_sides
+        if not triggered_sides:
+            return no_update
         
         # Track which sides were modified
         modified_sides = set()
         
         for slider_id, slider_value in zip(slider_ids, slider_values):
+            if slider_id.get('side') not in triggered_sides:
+                continue
+            
             if slider_value is None or not isinstance(slider_value, list) or len(slider_value) != 2:
                 continue
             
@@ -829,62 +1386,30 @@ def register_threshold_tweaker_callbacks(app):
             
             if side and category and side in question_thresholds:
                 if category in question_thresholds[side]:
+                    # Clone the side on first write so the source thresholds stay untouched
+                    if side not in modified_sides:
+                        question_thresholds[side] = dict(question_thresholds[side])
+                        modified_sides.add(side)
                     question_thresholds[side][category] = [int(min_val), int(max_val)]
-                    modified_sides.add(side)
         
         # Validate and adjust thresholds for all modified sides
         for side in modified_sides:
             if side in question_thresholds:
-                original_thresholds = copy.deepcopy(question_thresholds[side])
                 validated_thresholds = validate_and_adjust_thresholds(question_thresholds[side])
                 question_thresholds[side] = validated_thresholds
         
         return adjusted_thresholds
     
-    # Update threshold value display text
-    @app.callback(
+    # Update threshold value display text (clientside - pure formatting, no server round trip)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="updateValueDisplay"),
         Output({"type": "tweaker-value-display", "side": ALL, "category": ALL}, "children", allow_duplicate=True),
         Input("adjusted-thresholds-store", "data"),
-        [State("tweaker-current-side-store", "data"),
+        [State({"type": "tweaker-value-display", "side": ALL, "category": ALL}, "id"),
          State("threshold-config-store", "data"),
          State("data-store", "data")],
         prevent_initial_call=True
     )
-    def update_threshold_value_display(adjusted_thresholds, current_side, threshold_config, data):
-        """Update the threshold value display text when thresholds change"""
-        
-        if not adjusted_thresholds or not threshold_config:
-            return no_update
-        
-        # Determine question name - prioritize question_name from data-store (set during report generation)
-        # This ensures we use the correct question that was selected when generating the report
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
-        
-        # Fallback: detect from threshold_config if not in data-store
-        if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
-        
-        if not question_name or question_name not in adjusted_thresholds:
-            return no_update
-        
-        question_thresholds = adjusted_thresholds.get(question_name, {})
-        if current_side not in question_thresholds:
-            return no_update
-        
-        side_thresholds = question_thresholds[current_side]
-        categories = list(side_thresholds.keys())
-        
-        displays = []
-        for category in categories:
-            min_val, max_val = side_thresholds[category]
-            displays.append(f" [{int(min_val)}, {int(max_val)}]")
-        
-        return displays
     
     # Recalculate and update matrices when thresholds or model changes
     @app.callback(
@@ -901,7 +1426,9 @@ def register_threshold_tweaker_callbacks(app):
          Output("tweaker-ref-matrix-header", "children", allow_duplicate=True),
          Output("tweaker-adj-matrix-header", "children", allow_duplicate=True),
          Output("adjusted-thresholds-store", "data", allow_duplicate=True),
-         Output("optimization-loading", "style", allow_duplicate=True)],
+         Output("optimization-loading", "style", allow_duplicate=True),
+         Output("tweaker-ref-matrix-cache", "data", allow_duplicate=True),
+         Output("tweaker-matrix-signature-store", "data", allow_duplicate=True)],
         [Input("main-tabs", "active_tab"),
          Input("adjusted-thresholds-store", "data"),
          Input("reset-thresholds-btn", "n_clicks"),
@@ -910,10 +1437,21 @@ def register_threshold_tweaker_callbacks(app):
          Input("tweaker-model-store", "data")],
         [State("threshold-config-store", "data"),
          State("data-store", "data"),
-         State("tweaker-current-side-store", "data")],
+         State("tweaker-current-side-store", "data"),
+         State("tweaker-ref-matrix-cache", "data"),
+         State("tweaker-matrix-signature-store", "data"),
+         State("tweaker-ref-accuracy", "children"),
+         State("tweaker-ref-total", "children"),
+         State("tweaker-adj-accuracy", "children"),
+         State("tweaker-adj-total", "children"),
+         State("tweaker-changed", "children"),
+         State("impact-changed", "children"),
+         State("impact-delta", "children"),
+         State("impact-original", "children")],
         prevent_initial_call=True
     )
-    def recalculate_matrices(active_tab, adjusted_thresholds, reset_clicks, optimize_all_clicks, optimize_side_clicks, model, threshold_config, data, selected_side):
+    def recalculate_matrices(active_tab, adjusted_thresholds, reset_clicks, optimize_all_clicks, optimize_side_clicks, model, threshold_config, data, selected_side, ref_matrix_key, rendered_signature,
+                             shown_ref_accuracy, shown_ref_total, shown_adj_accuracy, shown_adj_total, shown_changed, shown_impact_changed, shown_impact_delta, shown_impact_original):
         """Recalculate confusion matrices when thresholds change"""
         
         # Default loading style (hidden)
@@ -921,11 +1459,11 @@ def register_threshold_tweaker_callbacks(app):
         
         # Only update if we're on the tweaker tab - check this FIRST
         if active_tab != "tweaker":
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
         
         ctx = callback_context
         if not ctx.triggered:
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
         
         trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
         
@@ -946,23 +1484,14 @@ def register_threshold_tweaker_callbacks(app):
             loading_style = {"display": "flex", "alignItems": "center", "gap": "10px"}
             if not threshold_config or not data:
                 loading_style = {"display": "none"}
-                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
             
             # Determine question name - prioritize question_name from data-store (set during report generation)
-            question_name = None
-            if data and isinstance(data, dict) and 'question_name' in data:
-                question_name = data['question_name']
-            
-            # Fallback: detect from threshold_config if not in data-store
-            if not question_name:
-                for key in threshold_config.keys():
-                    if 'physicalcondition' in key.lower():
-                        question_name = key
-                        break
+            question_name = _resolve_question_name(data, threshold_config)
             
             if not question_name:
                 loading_style = {"display": "none"}
-                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
             
             # Get current selected side if optimizing selected side only
             optimize_side = None
@@ -970,7 +1499,7 @@ def register_threshold_tweaker_callbacks(app):
                 optimize_side = selected_side
                 if not optimize_side:
                     loading_style = {"display": "none"}
-                    return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+                    return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
             
             # Normalize model value
             if not model:
@@ -991,61 +1520,70 @@ def register_threshold_tweaker_callbacks(app):
                 import traceback
                 traceback.print_exc()
                 loading_style = {"display": "none"}
-                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+                return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
             
             # Hide loading indicator after optimization completes
             loading_style = {"display": "none"}
         
-        # Handle model change - recalculate matrices when model store changes
-        # This ensures matrices update when switching between Deployed and New models
-        if trigger_id == "tweaker-model-store":
-            # Model changed - proceed to recalculate matrices with new model
-            # Initialize adjusted_thresholds if not set
-            if not adjusted_thresholds and threshold_config:
-                adjusted_thresholds = copy.deepcopy(threshold_config)
-            # Continue to recalculate matrices below (don't return early)
-        
+        # Model store changes fall through to the recalculation below, so matrices update
+        # when switching between Deployed and New models
         if not threshold_config or not data:
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
-        
-        # Initialize adjusted_thresholds if not set (for model changes or initial load)
-        if not adjusted_thresholds:
-            adjusted_thresholds = copy.deepcopy(threshold_config)
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
         
         # Determine question name - prioritize question_name from data-store (set during report generation)
-        # This ensures we use the correct question that was selected when generating the report
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
+        question_name = _resolve_question_name(data, threshold_config)
         
-        # Fallback: detect from threshold_config if not in data-store
         if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
         
-        if not question_name:
-            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style
+        # Initialize adjusted_thresholds if not set (for model changes or initial load), now that
+        # the guards above have passed
+        if not adjusted_thresholds:
+            adjusted_thresholds = _clone_thresholds(threshold_config)
         
         # Model normalization already done above, so we can use it directly here
         
         # Determine model name for headers
-        model_name = "Deployed Model" if model == "old" else "New Model"
-        ref_header = f"{model_name} (Reference Matrix)"
-        adj_header = f"{model_name} (Adjusted Matrix)"
+        ref_header, adj_header = _MATRIX_HEADERS[model]
+        
+        # A tab switch re-renders the (empty) matrix containers, so the reference figure must be sent again
+        if trigger_id == "main-tabs":
+            ref_matrix_key = None
+        
+        # Skip the recalculation when the client already shows matrices for exactly these inputs
+        # (e.g. the store write from initialize_tweaker_matrices, or a same-value model store write)
+        matrix_signature = _matrix_cache_key(data, threshold_config, adjusted_thresholds, question_name, model)
+        if (trigger_id in ("adjusted-thresholds-store", "tweaker-model-store")
+                and matrix_signature is not None and matrix_signature == rendered_signature):
+            return no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, no_update, loading_style, no_update, no_update
         
         # Recalculate classifications and generate matrices
-        results = recalculate_and_update_matrices(
-            data, threshold_config, adjusted_thresholds, question_name, model
+        results, ref_matrix_key = recalculate_and_update_matrices(
+            data, threshold_config, adjusted_thresholds, question_name, model, ref_matrix_key
         )
         
-        # Return results plus headers, updated thresholds, and loading style (14 outputs total)
-        return results + (ref_header, adj_header, adjusted_thresholds, loading_style,)
+        # Metric texts the client already shows are left untouched (most slider ticks only change a few)
+        shown_metrics = (shown_ref_accuracy, shown_ref_total, shown_adj_accuracy, shown_adj_total,
+                         shown_changed, shown_impact_changed, shown_impact_delta, shown_impact_original)
+        results = results[:2] + tuple(
+            no_update if value == shown else value
+            for value, shown in zip(results[2:], shown_metrics)
+        )
+        
+        # Return results plus headers, updated thresholds, loading style, reference matrix key and matrix signature (16 outputs total)
+        return results + (ref_header, adj_header, adjusted_thresholds, loading_style, ref_matrix_key, matrix_signature,)
     
     # Helper function to recalculate and update matrices
-    def recalculate_and_update_matrices(data, original_thresholds, adjusted_thresholds, question_name, model):
-        """Recalculate classifications and update confusion matrices"""
+    def _compute_tweaker_matrices(data, original_thresholds, adjusted_thresholds, question_name, model):
+        """
+        Recalculate classifications and build the confusion matrix displays
+        
+        Returns:
+            Tuple of (10 display values, reference matrix key, reference matrix data).
+            The first display value is a placeholder for the reference plot, which
+            recalculate_and_update_matrices builds from the reference matrix data.
+            Reference key and data are None when there is nothing to display.
+        """
         
         # Extract records
         if "data" in data:
@@ -1069,10 +1607,10 @@ def register_threshold_tweaker_callbacks(app):
                 "0",
                 "0%",
                 "0%"
-            )
+            ), None, None
         
-        # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(records)
+        # Convert to DataFrame for easier manipulation (cached per dataset - read-only)
+        df = _records_frame(data, records)
         
         # Normalize model value - handle None and ensure it's either "old" or "new"
         if not model:
@@ -1090,8 +1628,9 @@ def register_threshold_tweaker_callbacks(app):
             original_answer_col = "cscan_answer"
             adjusted_answer_col = "adjusted_cscan_answer"
         
-        # Check if required columns exist and have data
-        if original_answer_col not in df.columns:
+        # Check if required columns exist and have data (the data doesn't change between slider ticks)
+        answer_status = _answer_column_status(data, df, original_answer_col)
+        if answer_status == "missing_col":
             no_data_msg = html.Div([
                 html.H4("No data available", className="text-muted text-center"),
                 html.P(f"'{original_answer_col}' column not found in the dataset. Please ensure the data contains the required columns.", className="text-center text-muted")
@@ -1107,10 +1646,10 @@ def register_threshold_tweaker_callbacks(app):
                 "0",
                 "0%",
                 "0%"
-            )
+            ), None, None
         
         # Check if column has any non-null values
-        if df[original_answer_col].isna().all() or (df[original_answer_col].astype(str).str.strip() == '').all():
+        if answer_status == "all_empty":
             no_data_msg = html.Div([
                 html.H4("No data available", className="text-muted text-center"),
                 html.P(f"'{original_answer_col}' column exists but contains no valid data.", className="text-center text-muted")
@@ -1126,84 +1665,46 @@ def register_threshold_tweaker_callbacks(app):
                 "0",
                 "0%",
                 "0%"
-            )
-        
-        # Store original answers if not already stored
-        if adjusted_answer_col not in df.columns:
-            df[adjusted_answer_col] = df[original_answer_col]
+            ), None, None
         
-        # Recalculate answers with adjusted thresholds
+        # Recalculate answers with adjusted thresholds (vectorized over all records)
         question_thresholds = adjusted_thresholds.get(question_name, {})
-        severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
-        
-        adjusted_answers = []
-        changed_count = 0
-        
-        for idx, row in df.iterrows():
-            side_categories = []
+        adjusted_answers = compute_adjusted_answers(df, question_thresholds, score_prefix)
+        
+        # Count records whose non-empty original answer differs from the adjusted one
+        original_answers = df[original_answer_col]
+        has_original = original_answers.notna() & original_answers.astype(str).str.strip().ne('')
+        changed_count = int((has_original.to_numpy() & (original_answers.to_numpy() != adjusted_answers)).sum())
+        
+        # Shallow copy so the adjusted column doesn't leak into the cached frame
+        adjusted_df = df.copy(deep=False)
+        adjusted_df[adjusted_answer_col] = adjusted_answers
+        
+        # Generate reference matrix (original thresholds) - it doesn't depend on the sliders,
+        # so it is computed once per dataset, question, model and original thresholds
+        ref_key = _reference_matrix_key(data, original_thresholds, question_name, model)
+        ref_cache_key = _reference_cache_key(data, ref_key)
+        reference_matrix_data = _reference_cache.get(ref_cache_key)
+        if reference_matrix_data is None:
+            # Ensure we have a valid threshold_config dict with the question_name for ordering
+            if question_name not in original_thresholds:
+                print(f"⚠️ Warning: question_name '{question_name}' not found in original_thresholds")
             
-            for side in sides:
-                if side not in question_thresholds:
-                    continue
-                
-                score_col = f"{score_prefix}{side}_score"
-                if score_col not in df.columns:
-                    continue
-                
-                score = row[score_col]
-                if pd.isna(score):
-                    continue
-                
-                side_thresholds = question_thresholds[side]
-                category = get_category_from_score(float(score), side_thresholds)
-                
-                if category:
-                    side_categories.append(category)
-            
-            # Determine final answer based on severity priority
-            if not side_categories:
-                adjusted_answer = None
-            else:
-                # Find highest severity category
-                adjusted_answer = None
-                for cat in severity_order:
-                    if cat in side_categories:
-                        adjusted_answer = cat
-                        break
-                
-                if not adjusted_answer:
-                    adjusted_answer = side_categories[0] if side_categories else None
-            
-            adjusted_answers.append(adjusted_answer)
-            
-            # Check if changed
-            original_answer = row[original_answer_col]
-            if original_answer and str(original_answer).strip() and original_answer != adjusted_answer:
-                changed_count += 1
-        
-        df[adjusted_answer_col] = adjusted_answers
-        
-        # Generate reference matrix (original thresholds)
-        original_df = pd.DataFrame(records)
-        # Ensure we have a valid threshold_config dict with the question_name for ordering
-        if question_name not in original_thresholds:
-            print(f"⚠️ Warning: question_name '{question_name}' not found in original_thresholds")
-        
-        reference_matrix_data = prepare_matrix_data(
-            original_df,
-            original_answer_col,
-            'final_answer',
-            question_name,
-            original_thresholds  # Use original thresholds for category ordering
-        )
+            reference_matrix_data = prepare_matrix_data(
+                df,
+                original_answer_col,
+                'final_answer',
+                question_name,
+                original_thresholds  # Use original thresholds for category ordering
+            )
+            _reference_cache.put(ref_cache_key, reference_matrix_data)
         
         # Generate adjusted matrix (adjusted thresholds)
         # IMPORTANT: Use original_thresholds for category ordering to ensure consistent label order
         # The adjusted_thresholds are only used for calculating adjusted answers, not for ordering
         # Both matrices must use the same threshold_config to get the same category order from threshold.json
         adjusted_matrix_data = prepare_matrix_data(
-            df,  # Use DataFrame with adjusted answers
+            adjusted_df,  # Use DataFrame with adjusted answers
             adjusted_answer_col,
             'final_answer',
             question_name,
@@ -1218,10 +1719,8 @@ def register_threshold_tweaker_callbacks(app):
                 print(f"⚠️ WARNING: Label orders don't match between reference and adjusted matrices!")
         
         # Create plots as Dash Graph components
-        reference_fig = create_confusion_matrix_plot(reference_matrix_data, f"ref-{question_name}", "Reference Matrix")
+        # The reference plot is built by the caller, only when the client doesn't show it yet
         adjusted_fig = create_confusion_matrix_plot(adjusted_matrix_data, f"adj-{question_name}", "Adjusted Matrix")
-        
-        reference_plot = dcc.Graph(figure=reference_fig, config={'displayModeBar': True, 'displaylogo': False})
         adjusted_plot = dcc.Graph(figure=adjusted_fig, config={'displayModeBar': True, 'displaylogo': False})
         
         # Calculate metrics
@@ -1232,7 +1731,7 @@ def register_threshold_tweaker_callbacks(app):
         accuracy_delta = adj_accuracy - ref_accuracy
         
         return (
-            reference_plot,
+            None,
             adjusted_plot,
             f"{ref_accuracy:.2f}%",
             str(ref_total),
@@ -1242,12 +1741,49 @@ def register_threshold_tweaker_callbacks(app):
             str(changed_count),
             f"{accuracy_delta:+.2f}%",
             f"{ref_accuracy:.2f}%"
-        )
+        ), ref_key, reference_matrix_data
+    
+    def recalculate_and_update_matrices(data, original_thresholds, adjusted_thresholds, question_name, model, rendered_ref_key=None):
+        """
+        Recalculate classifications and update confusion matrices
+        
+        Results are memoized per (dataset, question, model, thresholds), so repeated
+        triggers with unchanged inputs (tab switches, same-value store writes) skip
+        the classification and the adjusted matrix build.
+        
+        Returns:
+            Tuple of (10 display values, reference matrix key). The reference plot is
+            no_update when rendered_ref_key shows the client already displays it.
+        """
+        cache_key = _matrix_cache_key(data, original_thresholds, adjusted_thresholds, question_name, model)
+        cached = _matrix_cache.get(cache_key)
+        if cached is None:
+            cached = _compute_tweaker_matrices(data, original_thresholds, adjusted_thresholds, question_name, model)
+            _matrix_cache.put(cache_key, cached)
+        values, ref_key, reference_matrix_data = cached
+        
+        if reference_matrix_data is None:
+            return values, ref_key
+        
+        # The reference matrix only depends on the data, model and original thresholds - skip
+        # building and re-sending it when the client already shows the same one
+        if ref_key == rendered_ref_key:
+            reference_plot = no_update
+        else:
+            ref_cache_key = _reference_cache_key(data, ref_key)
+            reference_plot = _reference_plot_cache.get(ref_cache_key)
+            if reference_plot is None:
+                reference_fig = create_confusion_matrix_plot(reference_matrix_data, f"ref-{question_name}", "Reference Matrix")
+                reference_plot = dcc.Graph(figure=reference_fig, config={'displayModeBar': True, 'displaylogo': False})
+                _reference_plot_cache.put(ref_cache_key, reference_plot)
+        
+        return (reference_plot,) + values[1:], ref_key
     
     # Optimize thresholds for maximum accuracy
     def optimize_thresholds_for_accuracy(data, original_thresholds, current_thresholds, question_name, model, selected_side=None):
         """
-        Optimize thresholds using coordinate descent with grid search.
+        Optimize thresholds with a coarse grid search per side, refined by stochastic
+        two-coordinate descent (see the refinement pass below).
         
         Args:
             data: Data dictionary with records
@@ -1260,9 +1796,6 @@ def register_threshold_tweaker_callbacks(app):
         Returns:
             Optimized threshold configuration
         """
-        import copy
-        from utils.threshold_handler import get_category_from_score, get_severity_order_from_thresholds
-        
         # Extract records
         if "data" in data:
             records = data["data"]
@@ -1272,14 +1805,31 @@ def register_threshold_tweaker_callbacks(app):
         if not records:
             return current_thresholds
         
-        df = pd.DataFrame(records)
-        
         # Normalize model value - handle None and ensure it's either "old" or "new"
         if not model:
             model = "old"  # Default to deployed model if not set
         elif model not in ["old", "new"]:
             model = "old"  # Default to deployed model if invalid value
         
+        # The search is deterministic, so a repeated click from the same starting thresholds
+        # reuses the earlier result
+        data_key = _data_key(data)
+        cache_key = _json_digest([
+            data_key,
+            question_name,
+            model,
+            selected_side,
+            current_thresholds.get(question_name, {}),
+        ]) if data_key else None
+        cached = _optimization_cache.get(cache_key)
+        if cached is not None:
+            print(f"♻️ Reusing cached optimization for {question_name} ({selected_side or 'all sides'})")
+            optimized_thresholds = _clone_thresholds(current_thresholds)
+            optimized_thresholds[question_name] = _clone_thresholds(cached)
+            return optimized_thresholds
+        
+        df = _records_frame(data, records)
+        
         # Determine which answer column to use based on model
         if model == "new":
             score_prefix = "new_"
@@ -1294,17 +1844,39 @@ def register_threshold_tweaker_callbacks(app):
         if actual_col not in df.columns:
             return current_thresholds
         
+        # Score and ground truth arrays shared by every candidate evaluation
+        prepared = prepare_accuracy_inputs(df, score_prefix, actual_col, question_name)
+        
         # Deep copy current thresholds
-        optimized_thresholds = copy.deepcopy(current_thresholds)
+        optimized_thresholds = _clone_thresholds(current_thresholds)
         question_thresholds = optimized_thresholds.get(question_name, {})
         
         # Determine which sides to optimize
-        sides_to_optimize = [selected_side] if selected_side and selected_side in question_thresholds else list(question_thresholds.keys())
+        sides_to_optimize = [selected_side] if selected_side and selected_side in question_thresholds else list(question_thresholds)
         
         # Grid search parameters
-        step_size = 10  # Search in steps of 10 for efficiency
+        step_size = 10  # Coarse pass in steps of 10 for efficiency
+        refine_radii = (10, 5, 2, 1)  # Line-search radius schedule for the refinement pass
+        refine_points = 20  # Points per boundary in each line search
         min_score = 0
         max_score = 100
+        rng = random.Random(0)  # Fixed seed so the same inputs always optimize to the same thresholds
+        perfect_accuracy = 100.0  # Search for a side stops once it is reached
+        
+        def candidate_accuracy(side, candidate_thresholds):
+            """Accuracy with one side's thresholds replaced by candidate_thresholds"""
+            # The evaluator only reads this question's thresholds, so override the one side instead of
+            # cloning the whole configuration per candidate
+            test_thresholds = {question_name: {**optimized_thresholds[question_name], side: candidate_thresholds}}
+            return evaluate_threshold_accuracy(
+                df, test_thresholds, question_name, model, score_prefix, answer_col, actual_col, prepared
+            )
+        
+        def score_candidates(side, candidate_list):
+            """Accuracies of candidate_list in order, scored on the worker pool when there is one"""
+            if _candidate_pool is None or len(candidate_list) < 2:
+                return [candidate_accuracy(side, candidate) for candidate in candidate_list]
+            return list(_candidate_pool.map(lambda candidate: candidate_accuracy(side, candidate), candidate_list))
         
         # Optimize each side
         for side in sides_to_optimize:
@@ -1312,94 +1884,173 @@ def register_threshold_tweaker_callbacks(app):
                 continue
             
             side_thresholds = question_thresholds[side]
-            categories = list(side_thresholds.keys())
+            categories = list(side_thresholds)
             
             if len(categories) == 0:
                 continue
             
             best_accuracy = -1
-            best_thresholds = copy.deepcopy(side_thresholds)
+            best_thresholds = {k: list(v) for k, v in side_thresholds.items()}
             
-            # Generate candidate threshold combinations
+            # Coarse pass: generate candidate threshold combinations
             # For each category, try different min/max values
             candidates = generate_threshold_candidates(side_thresholds, step_size, min_score, max_score)
             
-            # Evaluate each candidate
-            for candidate_thresholds in candidates:
-                # Test this candidate
-                test_thresholds = copy.deepcopy(optimized_thresholds)
-                test_thresholds[question_name][side] = candidate_thresholds
-                
-                # Calculate accuracy with these thresholds
-                accuracy = evaluate_threshold_accuracy(
-                    df, test_thresholds, question_name, model, score_prefix, answer_col, actual_col
-                )
-                
-                if accuracy > best_accuracy:
-                    best_accuracy = accuracy
-                    best_thresholds = candidate_thresholds
+            # Evaluate candidates in batches on the worker pool; each batch is scanned in generation
+            # order so ties keep the first candidate (nothing can beat a perfect score, so stop there)
+            batch_size = _CANDIDATE_WORKERS * 4
+            while best_accuracy < perfect_accuracy:
+                batch = list(islice(candidates, batch_size))
+                if not batch:
+                    break
+                for candidate_thresholds, accuracy in zip(batch, score_candidates(side, batch)):
+                    if accuracy > best_accuracy:
+                        best_accuracy = accuracy
+                        best_thresholds = candidate_thresholds
+                        if best_accuracy >= perfect_accuracy:
+                            break
+            
+            # Refinement: stochastic two-coordinate descent. Random pairs of (category, min|max)
+            # boundaries are line-searched together around the current best, and any improvement is
+            # kept; each radius is swept until a full sweep no longer improves accuracy
+            best_thresholds = {k: list(v) for k, v in best_thresholds.items()}
+            if best_accuracy < 0:
+                best_accuracy = candidate_accuracy(side, best_thresholds)
+            evaluated = {}  # candidate boundaries -> accuracy, so overlapping line searches aren't re-scored
+            coordinates = [(cat, bound) for cat in categories for bound in (0, 1)]
+            
+            for radius in refine_radii:
+                offsets = list(dict.fromkeys(np.rint(np.linspace(-radius, radius, refine_points)).astype(int).tolist()))
+                improved = True
+                while improved and best_accuracy < perfect_accuracy:
+                    improved = False
+                    rng.shuffle(coordinates)
+                    for (cat_a, bound_a), (cat_b, bound_b) in zip(coordinates[0::2], coordinates[1::2]):
+                        if best_accuracy >= perfect_accuracy:
+                            break
+                        
+                        values_a = dict.fromkeys(max(min_score, min(max_score, best_thresholds[cat_a][bound_a] + offset)) for offset in offsets)
+                        values_b = dict.fromkeys(max(min_score, min(max_score, best_thresholds[cat_b][bound_b] + offset)) for offset in offsets)
+                        # Categories the pair leaves alone are carried over, so they must already be valid
+                        others_valid = all(
+                            validate_thresholds({cat: bounds}) for cat, bounds in best_thresholds.items() if cat not in (cat_a, cat_b)
+                        )
+                        if not others_valid:
+                            continue
+                        
+                        pair_candidates = []
+                        for value_a in values_a:
+                            for value_b in values_b:
+                                # Only the one or two changed categories are copied and validated
+                                changed = {cat_a: list(best_thresholds[cat_a]), cat_b: list(best_thresholds[cat_b])}
+                                changed[cat_a][bound_a] = value_a
+                                changed[cat_b][bound_b] = value_b
+                                if not validate_thresholds(changed):
+                                    continue
+                                
+                                # Hashable key of the whole candidate; its dict is only built when it needs scoring
+                                candidate_key = frozenset(
+                                    (cat, *changed.get(cat, bounds)) for cat, bounds in best_thresholds.items()
+                                )
+                                pair_candidates.append((candidate_key, changed))
+                        
+                        # Score the grid's new candidates together on the worker pool
+                        pending = {
+                            candidate_key: {cat: list(changed.get(cat, bounds)) for cat, bounds in best_thresholds.items()}
+                            for candidate_key, changed in pair_candidates
+                            if candidate_key not in evaluated
+                        }
+                        evaluated.update(zip(pending, score_candidates(side, list(pending.values()))))
+                        
+                        pair_best = None
+                        pair_accuracy = best_accuracy
+                        for candidate_key, changed in pair_candidates:
+                            accuracy = evaluated[candidate_key]
+                            if accuracy > pair_accuracy + 1e-3:
+                                pair_accuracy = accuracy
+                                pair_best = {cat: list(changed.get(cat, bounds)) for cat, bounds in best_thresholds.items()}
+                        
+                        if pair_best is not None:
+                            best_accuracy = pair_accuracy
+                            best_thresholds = pair_best
+                            improved = True
             
             # Update with best thresholds for this side
             optimized_thresholds[question_name][side] = best_thresholds
         
+        if question_name in optimized_thresholds:
+            _optimization_cache.put(cache_key, _clone_thresholds(optimized_thresholds[question_name]))
+        
         return optimized_thresholds
     
     def generate_threshold_candidates(side_thresholds, step_size, min_score, max_score):
         """
         Generate candidate threshold combinations for a side.
         Maintains category order and ensures min < max.
+        Yields candidates lazily (each dict is only built when the optimizer asks for it).
         """
-        import copy
         
-        categories = list(side_thresholds.keys())
+        categories = list(side_thresholds)
         if len(categories) == 0:
-            return []
+            return
         
         # For simplicity, we'll use a constrained search:
         # Try adjusting boundaries between categories
         # This is more efficient than full grid search
         
-        candidates = []
-        
         # Strategy: Try shifting category boundaries
-        # For each category, try adjusting min and max by ±step_size
+        # For each category, every (min, max) pair of ±step_size adjustments, built as one 5x5 grid
+        adjustments = np.array([-step_size, -step_size//2, 0, step_size//2, step_size])
+        category_valid = [validate_thresholds({cat: side_thresholds[cat]}) for cat in categories]
+        base_row = np.array([side_thresholds[cat] for cat in categories], dtype=float).ravel()
+        
+        rows = []  # Flattened boundaries of every candidate, for deduplication
+        changes = []  # (category, new_min, new_max) per candidate; None keeps the original thresholds
+        
+        # Always include original thresholds, first: the optimizer keeps the first of equally good
+        # candidates, so thresholds only move for an actual gain
+        if validate_thresholds(side_thresholds):
+            rows.append(base_row[np.newaxis, :])
+            changes.append(None)
         for cat_idx, cat in enumerate(categories):
+            # The other categories are carried over unchanged, so they must already be valid
+            if not all(valid for idx, valid in enumerate(category_valid) if idx != cat_idx):
+                continue
+            
             min_val, max_val = side_thresholds[cat]
+            raw_mins, raw_maxs = np.meshgrid(np.asarray(min_val) + adjustments, np.asarray(max_val) + adjustments, indexing='ij')
+            raw_mins, raw_maxs = raw_mins.ravel(), raw_maxs.ravel()
+            new_mins = np.clip(raw_mins, min_score, max_score)
+            new_maxs = np.clip(raw_maxs, min_score, max_score)
             
-            # Try different min values
-            for min_adj in [-step_size, -step_size//2, 0, step_size//2, step_size]:
-                new_min = max(min_score, min(max_score, min_val + min_adj))
-                # Try different max values
-                for max_adj in [-step_size, -step_size//2, 0, step_size//2, step_size]:
-                    new_max = max(min_score, min(max_score, max_val + max_adj))
-                    
-                    if new_min < new_max:
-                        candidate = copy.deepcopy(side_thresholds)
-                        candidate[cat] = [new_min, new_max]
-                        
-                        # Ensure constraints: min < max and no overlaps
-                        if validate_thresholds(candidate):
-                            candidates.append(candidate)
+            # Ensure constraints: min < max within the 0-100 score range
+            keep = (new_mins < new_maxs) & (new_mins >= 0) & (new_maxs <= 100)
+            
+            cat_rows = np.repeat(base_row[np.newaxis, :], int(keep.sum()), axis=0)
+            cat_rows[:, 2 * cat_idx] = new_mins[keep]
+            cat_rows[:, 2 * cat_idx + 1] = new_maxs[keep]
+            rows.append(cat_rows)
+            # Unclamped values are kept so the returned candidates are clamped with Python's min/max
+            # (which keep the type of the original threshold)
+            changes.extend((cat, raw_min, raw_max) for raw_min, raw_max in zip(raw_mins[keep].tolist(), raw_maxs[keep].tolist()))
         
-        # Always include original thresholds
-        if validate_thresholds(side_thresholds):
-            candidates.append(side_thresholds)
+        if not changes:
+            return
         
-        # Remove duplicates (by converting to string representation)
-        unique_candidates = []
-        seen = set()
-        for cand in candidates:
-            cand_str = str(sorted(cand.items()))
-            if cand_str not in seen:
-                seen.add(cand_str)
-                unique_candidates.append(cand)
+        # Remove duplicates, keeping the first occurrence of each candidate in generation order
+        _, first_indices = np.unique(np.concatenate(rows), axis=0, return_index=True)
         
         # Limit to reasonable number for performance
-        return unique_candidates[:100] if len(unique_candidates) > 100 else unique_candidates
+        for index in np.sort(first_indices)[:100]:
+            candidate = {k: list(v) for k, v in side_thresholds.items()}
+            if changes[index] is not None:
+                cat, raw_min, raw_max = changes[index]
+                candidate[cat] = [max(min_score, min(max_score, raw_min)), max(min_score, min(max_score, raw_max))]
+            yield candidate
     
     def validate_thresholds(side_thresholds):
         """Validate that thresholds are valid (min < max, no overlaps)"""
-        categories = list(side_thresholds.keys())
+        categories = list(side_thresholds)
         if len(categories) == 0:
             return False
         
@@ -1414,75 +2065,65 @@ def register_threshold_tweaker_callbacks(app):
         # Categories can have overlapping ranges, so we don't enforce strict non-overlap
         return True
     
-    def evaluate_threshold_accuracy(df, thresholds, question_name, model, score_prefix, answer_col, actual_col):
+    def prepare_accuracy_inputs(df, score_prefix, actual_col, question_name):
+        """
+        Arrays evaluate_threshold_accuracy needs, extracted once per optimization run
+        (they don't depend on the candidate thresholds)
+        """
+        from utils.threshold_handler import normalize_category_for_confusion_matrix
+        
+        # Ground truth, normalized once per distinct value; None where it is missing or blank
+        actual = df[actual_col]
+        actual_valid = (actual.notna() & actual.astype(str).str.strip().ne('')).to_numpy()
+        normalized = {
+            value: normalize_category_for_confusion_matrix(str(value), question_name)
+            for value in actual[actual_valid].unique()
+        }
+        # Integer-coded so candidates are scored with array comparisons; -1 where invalid
+        label_codes = {label: code for code, label in enumerate(dict.fromkeys(normalized.values()))}
+        actual_codes = np.full(len(df), -1, dtype=np.int32)
+        actual_codes[actual_valid] = actual[actual_valid].map(normalized).map(label_codes).to_numpy(dtype=np.int32)
+        
+        return {
+            "scores": _score_arrays(df, score_prefix),
+            "actual_codes": actual_codes,
+            "actual_valid": actual_valid,
+            "label_codes": label_codes,
+            "side_ranks": {},  # per-side rank columns, shared by all candidates of the run
+        }
+    
+    def evaluate_threshold_accuracy(df, thresholds, question_name, model, score_prefix, answer_col, actual_col, prepared=None):
         """
         Evaluate accuracy for given thresholds by recalculating answers.
         Note: answer_col parameter is not used - answers are recalculated from scores and thresholds.
+        prepared: Optional result of prepare_accuracy_inputs (built here when not given).
         Returns accuracy percentage.
         """
-        from utils.threshold_handler import get_category_from_score, get_severity_order_from_thresholds
+        from utils.threshold_handler import normalize_category_for_confusion_matrix
         
         question_thresholds = thresholds.get(question_name, {})
         if not question_thresholds:
             return 0.0
         
-        severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
+        if prepared is None:
+            prepared = prepare_accuracy_inputs(df, score_prefix, actual_col, question_name)
         
-        predicted_answers = []
+        # Classify all records at once (most severe side category wins)
+        winner, severity_order = _severity_winner(prepared["scores"], question_thresholds, len(df), prepared["side_ranks"])
         
-        for idx, row in df.iterrows():
-            side_categories = []
-            
-            for side in sides:
-                if side not in question_thresholds:
-                    continue
-                
-                score_col = f"{score_prefix}{side}_score"
-                if score_col not in df.columns:
-                    continue
-                
-                score = row[score_col]
-                if pd.isna(score):
-                    continue
-                
-                side_thresholds = question_thresholds[side]
-                category = get_category_from_score(float(score), side_thresholds)
-                
-                if category:
-                    side_categories.append(category)
-            
-            # Determine final answer based on severity priority
-            if not side_categories:
-                predicted_answer = None
-            else:
-                predicted_answer = None
-                for cat in severity_order:
-                    if cat in side_categories:
-                        predicted_answer = cat
-                        break
-                
-                if not predicted_answer:
-                    predicted_answer = side_categories[0] if side_categories else None
-            
-            predicted_answers.append(predicted_answer)
-        
-        # Calculate accuracy
-        correct = 0
-        total = 0
-        for idx, row in df.iterrows():
-            predicted = predicted_answers[idx] if idx < len(predicted_answers) else None
-            actual = row[actual_col]
-            
-            if pd.notna(actual) and str(actual).strip() and predicted:
-                total += 1
-                # Normalize for comparison
-                from utils.threshold_handler import normalize_category_for_confusion_matrix
-                pred_norm = normalize_category_for_confusion_matrix(str(predicted), question_name)
-                actual_norm = normalize_category_for_confusion_matrix(str(actual), question_name)
-                
-                if pred_norm == actual_norm:
-                    correct += 1
+        # Map each rank to its normalized label's code (categories are normalized once each);
+        # -2 for labels absent from the ground truth, which can never match
+        label_codes = prepared["label_codes"]
+        rank_codes = np.array([
+            label_codes.get(normalize_category_for_confusion_matrix(str(category), question_name), -2)
+            for category in severity_order
+        ] + [-2], dtype=np.int32)
+        predicted_codes = rank_codes[winner]
+        
+        # Calculate accuracy over records with both a ground truth and a predicted category
+        evaluated = prepared["actual_valid"] & (winner < len(severity_order))
+        total = int(evaluated.sum())
+        correct = int((evaluated & (predicted_codes == prepared["actual_codes"])).sum())
         
         accuracy = (correct / total * 100) if total > 0 else 0.0
         return accuracy
@@ -1508,23 +2149,17 @@ def register_threshold_tweaker_callbacks(app):
         if not records:
             return [], [], []
         
-        # Get unique values for each filter
-        cscan_answers = set()
-        new_cscan_answers = set()
-        final_answers = set()
-        
-        for record in records:
-            if record.get('cscan_answer'):
-                cscan_answers.add(str(record['cscan_answer']).strip())
-            if record.get('new_cscan_answer'):
-                new_cscan_answers.add(str(record['new_cscan_answer']).strip())
-            if record.get('final_answer'):
-                final_answers.add(str(record['final_answer']).strip())
+        # Get unique values for each filter (only the three answer columns are read)
+        answer_cols = ['cscan_answer', 'new_cscan_answer', 'final_answer']
+        df = pd.DataFrame(records, columns=answer_cols)
         
-        cscan_options = [{"label": val, "value": val} for val in sorted(cscan_answers)]
-        new_cscan_options = [{"label": val, "value": val} for val in sorted(new_cscan_answers)]
-        final_options = [{"label": val, "value": val} for val in sorted(final_answers)]
+        options = []
+        for col in answer_cols:
+            # Categories are the distinct non-missing answers
+            values = sorted({str(val).strip() for val in df[col].astype('category').cat.categories} - {''})
+            options.append([{"label": val, "value": val} for val in values])
         
+        cscan_options, new_cscan_options, final_options = options
         return cscan_options, new_cscan_options, final_options
     
     # Apply filters to changed records
@@ -1559,106 +2194,87 @@ def register_threshold_tweaker_callbacks(app):
         if not records:
             return no_update
         
-        # Reset filters
-        if trigger_id == "tweaker-reset-filters-btn":
-            return {"data": records, "filtered": records}
+        def score_filter_active(score_range, side_filter):
+            """A score filter applies when its range is narrowed or a side is picked"""
+            if not (score_range and isinstance(score_range, list) and len(score_range) == 2):
+                return False
+            is_default_range = score_range[0] == 0 and score_range[1] == 100
+            return not is_default_range or bool(side_filter)
+        
+        deployed_score_active = score_filter_active(deployed_score_range, deployed_score_side_filter)
+        new_score_active = score_filter_active(new_score_range, new_score_side_filter)
+        any_active = (
+            bool(cscan_filter) or bool(new_cscan_filter) or bool(final_filter)
+            or bool(side_filter) or bool(new_side_filter)
+            or deployed_score_active or new_score_active
+        )
         
-        # Apply filters (same logic as image viewer)
-        filtered = records
+        # Reset filters, or nothing to filter on
+        if trigger_id == "tweaker-reset-filters-btn" or not any_active:
+            return {"data": records, "filtered_index": None}
         
-        def normalize_for_comparison(value):
-            if not value:
-                return None
-            return str(value).lower().strip()
+        # Apply filters (same logic as image viewer) as boolean masks over one DataFrame
+        df = pd.DataFrame(records)
+        mask = np.ones(len(df), dtype=bool)
+        
+        def category_mask(col, predicate, missing):
+            """Evaluate predicate once per distinct value of col (as category codes) and map it onto the rows"""
+            if col not in df.columns:
+                return np.full(len(df), missing, dtype=bool)
+            values = df[col].astype('category')
+            matches = np.array([predicate(value) for value in values.cat.categories] + [missing], dtype=bool)
+            return matches[values.cat.codes.to_numpy()]  # code -1 (missing) picks the last slot
+        
+        def answer_mask(col, selected):
+            """Records whose answer matches one of the selected values (case/whitespace-insensitive)"""
+            selected = {str(value).lower().strip() for value in selected if value}
+            return category_mask(col, lambda answer: str(answer).lower().strip() in selected, False)
+        
+        def side_mask(col, selected):
+            """Records whose contributing sides mention a selected side ('_blank_' matches no sides)"""
+            match_blank = '_blank_' in selected
+            sides = [side for side in selected if side != '_blank_']
+            
+            def matches(sides_text):
+                sides_text = str(sides_text).lower()
+                return (match_blank and sides_text.strip() == '') or any(side in sides_text for side in sides)
+            
+            return category_mask(col, matches, match_blank)
         
         # CScan Answer filter
         if cscan_filter and len(cscan_filter) > 0:
-            normalized_cscan_filter = [normalize_for_comparison(v) for v in cscan_filter]
-            filtered = [r for r in filtered if normalize_for_comparison(r.get('cscan_answer', '')) in normalized_cscan_filter]
+            mask &= answer_mask('cscan_answer', cscan_filter)
         
         # New CScan Answer filter
         if new_cscan_filter and len(new_cscan_filter) > 0:
-            normalized_new_cscan_filter = [normalize_for_comparison(v) for v in new_cscan_filter]
-            filtered = [r for r in filtered if normalize_for_comparison(r.get('new_cscan_answer', '')) in normalized_new_cscan_filter]
+            mask &= answer_mask('new_cscan_answer', new_cscan_filter)
         
         # Final Answer filter
         if final_filter and len(final_filter) > 0:
-            normalized_final_filter = [normalize_for_comparison(v) for v in final_filter]
-            filtered = [r for r in filtered if normalize_for_comparison(r.get('final_answer', '')) in normalized_final_filter]
+            mask &= answer_mask('final_answer', final_filter)
         
         # Contributing Sides filter
         if side_filter and len(side_filter) > 0:
-            def matches_side_filter(record):
-                contributing_sides = str(record.get('contributing_sides', '')).lower()
-                if '_blank_' in side_filter:
-                    if not contributing_sides or contributing_sides.strip() == '':
-                        return True
-                return any(side in contributing_sides for side in side_filter if side != '_blank_')
-            filtered = [r for r in filtered if matches_side_filter(r)]
+            mask &= side_mask('contributing_sides', side_filter)
         
         # New Contributing Sides filter
         if new_side_filter and len(new_side_filter) > 0:
-            def matches_new_side_filter(record):
-                new_contributing_sides = str(record.get('new_contributing_sides', '')).lower()
-                if '_blank_' in new_side_filter:
-                    if not new_contributing_sides or new_contributing_sides.strip() == '':
-                        return True
-                return any(side in new_contributing_sides for side in new_side_filter if side != '_blank_')
-            filtered = [r for r in filtered if matches_new_side_filter(r)]
+            mask &= side_mask('new_contributing_sides', new_side_filter)
         
         # Deployed Side Score filter
-        if deployed_score_range and isinstance(deployed_score_range, list) and len(deployed_score_range) == 2:
+        if deployed_score_active:
             score_min, score_max = deployed_score_range[0], deployed_score_range[1]
-            is_default_range = score_min == 0 and score_max == 100
-            has_side_filter = deployed_score_side_filter and len(deployed_score_side_filter) > 0
-            
-            if not is_default_range or has_side_filter:
-                def matches_deployed_score_filter(record):
-                    sides_to_check = ['top', 'bottom', 'left', 'right', 'back', 'front']
-                    if deployed_score_side_filter and len(deployed_score_side_filter) > 0:
-                        sides_to_check = deployed_score_side_filter
-                    
-                    for side in sides_to_check:
-                        score_col = f"{side}_score"
-                        if score_col in record:
-                            score_val = record[score_col]
-                            if score_val is not None and score_val != '':
-                                try:
-                                    score_float = float(score_val)
-                                    if score_min <= score_float <= score_max:
-                                        return True
-                                except (ValueError, TypeError):
-                                    continue
-                    return False
-                filtered = [r for r in filtered if matches_deployed_score_filter(r)]
+            sides_to_check = deployed_score_side_filter if deployed_score_side_filter else list(_SIDES)
+            mask &= _score_range_mask(df, sides_to_check, "", score_min, score_max)
         
         # New Side Score filter
-        if new_score_range and isinstance(new_score_range, list) and len(new_score_range) == 2:
+        if new_score_active:
             score_min, score_max = new_score_range[0], new_score_range[1]
-            is_default_range = score_min == 0 and score_max == 100
-            has_side_filter = new_score_side_filter and len(new_score_side_filter) > 0
-            
-            if (not is_default_range or has_side_filter):
-                def matches_new_score_filter(record):
-                    sides_to_check = ['top', 'bottom', 'left', 'right', 'back', 'front']
-                    if new_score_side_filter and len(new_score_side_filter) > 0:
-                        sides_to_check = new_score_side_filter
-                    
-                    for side in sides_to_check:
-                        score_col = f"new_{side}_score"
-                        if score_col in record:
-                            score_val = record[score_col]
-                            if score_val is not None and score_val != '':
-                                try:
-                                    score_float = float(score_val)
-                                    if score_min <= score_float <= score_max:
-                                        return True
-                                except (ValueError, TypeError):
-                                    continue
-                    return False
-                filtered = [r for r in filtered if matches_new_score_filter(r)]
+            sides_to_check = new_score_side_filter if new_score_side_filter else list(_SIDES)
+            mask &= _score_range_mask(df, sides_to_check, "new_", score_min, score_max)
         
-        return {"data": records, "filtered": filtered}
+        # Store row positions rather than a second copy of the matching records
+        return {"data": records, "filtered_index": np.flatnonzero(mask).tolist()}
     
     # Reset filter dropdowns
     @app.callback(
@@ -1681,7 +2297,8 @@ def register_threshold_tweaker_callbacks(app):
     # View changed records (auto-triggered on threshold changes)
     @app.callback(
         [Output("tweaker-changed-records-display", "children"),
-         Output("tweaker-changed-records-store", "data")],
+         Output("tweaker-changed-records-store", "data"),
+         Output("tweaker-filtered-count-store", "data")],
         [Input("adjusted-thresholds-store", "data"),
          Input("tweaker-model-store", "data"),
          Input("main-tabs", "active_tab"),
@@ -1699,10 +2316,10 @@ def register_threshold_tweaker_callbacks(app):
         
         # Only update if we're on the tweaker tab
         if active_tab != "tweaker":
-            return no_update, no_update
+            return no_update, no_update, no_update
         
         if not data or not adjusted_thresholds or not threshold_config:
-            return no_update, no_update
+            return no_update, no_update, no_update
         
         # Extract records from main data store
         if "data" in data:
@@ -1711,22 +2328,13 @@ def register_threshold_tweaker_callbacks(app):
             records = data if isinstance(data, list) else []
         
         if not records:
-            return html.Div("No data available", className="text-center text-muted py-5"), {}
+            return html.Div("No data available", className="text-center text-muted py-5"), {}, 0
         
         # Determine question name - prioritize question_name from data-store (set during report generation)
-        question_name = None
-        if data and isinstance(data, dict) and 'question_name' in data:
-            question_name = data['question_name']
+        question_name = _resolve_question_name(data, threshold_config)
         
-        # Fallback: detect from threshold_config if not in data-store
         if not question_name:
-            for key in threshold_config.keys():
-                if 'physicalcondition' in key.lower():
-                    question_name = key
-                    break
-        
-        if not question_name:
-            return html.Div("No question configuration found", className="text-center text-muted py-5"), {}
+            return html.Div("No question configuration found", className="text-center text-muted py-5"), {}, 0
         
         # Normalize model value - handle None and ensure it's either "old" or "new"
         if not model:
@@ -1734,116 +2342,7 @@ def register_threshold_tweaker_callbacks(app):
         elif model not in ["old", "new"]:
             model = "old"  # Default to deployed model if invalid value
         
-        # Determine which answer column to use
-        if model == "new":
-            original_answer_col = "new_cscan_answer"
-            adjusted_answer_col = "adjusted_new_cscan_answer"
-            score_prefix = "new_"
-        else:
-            original_answer_col = "cscan_answer"
-            adjusted_answer_col = "adjusted_cscan_answer"
-            score_prefix = ""
-        
-        # Recalculate to get adjusted answers
-        df = pd.DataFrame(records)
-        question_thresholds = adjusted_thresholds.get(question_name, {})
-        severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
-        
-        # Recalculate adjusted answers and contributing sides
-        adjusted_answers = []
-        adjusted_contributing_sides_list = []
-        
-        for idx, row in df.iterrows():
-            side_categories = []  # List of tuples: (side, category, score)
-            
-            for side in sides:
-                if side not in question_thresholds:
-                    continue
-                score_col = f"{score_prefix}{side}_score"
-                if score_col not in df.columns:
-                    continue
-                score = row[score_col]
-                if pd.isna(score):
-                    continue
-                side_thresholds = question_thresholds[side]
-                category = get_category_from_score(float(score), side_thresholds)
-                if category:
-                    side_categories.append((side, category, score))
-            
-            # Calculate adjusted answer
-            if not side_categories:
-                adjusted_answer = None
-            else:
-                adjusted_answer = None
-                categories_only = [cat for _, cat, _ in side_categories]
-                for cat in severity_order:
-                    if cat in categories_only:
-                        adjusted_answer = cat
-                        break
-                if not adjusted_answer:
-                    adjusted_answer = categories_only[0] if categories_only else None
-            
-            adjusted_answers.append(adjusted_answer)
-            
-            # Calculate adjusted contributing sides based on adjusted answer
-            if not adjusted_answer or pd.isna(adjusted_answer) or (isinstance(adjusted_answer, str) and not adjusted_answer.strip()):
-                adjusted_contributing_sides_list.append(None)
-            else:
-                # Check if adjusted_answer is the least severe category
-                if is_least_severe_category(adjusted_answer, question_name, threshold_config):
-                    adjusted_contributing_sides_list.append(None)
-                else:
-                    # Find all sides that match the adjusted_answer
-                    contributing_sides = [side for side, cat, _ in side_categories if cat == adjusted_answer]
-                    adjusted_contributing_sides_list.append(', '.join(contributing_sides) if contributing_sides else None)
-        
-        df[adjusted_answer_col] = adjusted_answers
-        df[f"adjusted_{score_prefix}contributing_sides" if score_prefix else "adjusted_contributing_sides"] = adjusted_contributing_sides_list
-        
-        # Find changed records and add score information
-        changed_records = []
-        for idx, row in df.iterrows():
-            original = row[original_answer_col]
-            adjusted = row[adjusted_answer_col]
-            if original and str(original).strip() and original != adjusted:
-                record_dict = row.to_dict()
-                record_dict['original_answer'] = original
-                record_dict['adjusted_answer'] = adjusted
-                
-                # Get adjusted contributing sides
-                adjusted_contrib_col = f"adjusted_{score_prefix}contributing_sides" if score_prefix else "adjusted_contributing_sides"
-                adjusted_contrib_sides_str = row.get(adjusted_contrib_col, '') or None
-                
-                # Update the answer column with adjusted value so table shows it
-                record_dict[original_answer_col] = adjusted
-                
-                # Update the contributing sides column with adjusted value so table shows it
-                if score_prefix:
-                    # For new model
-                    record_dict['new_contributing_sides'] = adjusted_contrib_sides_str if adjusted_contrib_sides_str else (row.get('new_contributing_sides', '') or '')
-                else:
-                    # For deployed model
-                    record_dict['contributing_sides'] = adjusted_contrib_sides_str if adjusted_contrib_sides_str else (row.get('contributing_sides', '') or '')
-                
-                # Add contributing sides scores (only for sides that contributed to the adjusted answer)
-                contributing_scores = []
-                contributing_sides_list = []
-                
-                if adjusted_contrib_sides_str:
-                    contributing_sides_list = [s.strip().lower() for s in str(adjusted_contrib_sides_str).split(',') if s.strip()]
-                    
-                    # Only add scores for contributing sides
-                    for side in contributing_sides_list:
-                        score_col = f"{score_prefix}{side}_score"
-                        if score_col in df.columns:
-                            score = row[score_col]
-                            if pd.notna(score):
-                                contributing_scores.append(f"{side}: {score:.2f}")
-                
-                record_dict['contributing_scores'] = ", ".join(contributing_scores) if contributing_scores else "N/A"
-                
-                changed_records.append(record_dict)
+        changed_records = _changed_records(data, records, adjusted_thresholds, threshold_config, question_name, model)
         
         # Check if we have filtered data from filter callback
         ctx = callback_context
@@ -1852,8 +2351,10 @@ def register_threshold_tweaker_callbacks(app):
             trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
         
         # If triggered by filter store change, use filtered data
-        if trigger_id == "tweaker-changed-records-store" and filtered_data and isinstance(filtered_data, dict):
-            records_to_display = filtered_data.get("filtered", changed_records)
+        filtered_index = None
+        if trigger_id == "tweaker-changed-records-store" and filtered_data and isinstance(filtered_data, dict) and "data" in filtered_data:
+            filtered_index = filtered_data.get("filtered_index")
+            records_to_display = _filtered_changed_records(filtered_data)
         else:
             records_to_display = changed_records
         
@@ -1863,13 +2364,13 @@ def register_threshold_tweaker_callbacks(app):
                     html.H4("✅ No records changed", className="alert-heading"),
                     html.P("Adjust thresholds to see impacted records", className="mb-0")
                 ], color="info", className="text-center")
-            ], className="py-5"), {"data": changed_records, "filtered": changed_records}
+            ], className="py-5"), {"data": changed_records, "filtered_index": None}, len(changed_records)
         
         # Create filtered data store format
         store_data = {
             "data": changed_records,
-            "filtered": records_to_display,
-            "columns": list(changed_records[0].keys()) if changed_records else [],
+            "filtered_index": filtered_index,
+            "columns": list(changed_records[0]) if changed_records else [],
             "source": "threshold_tweaker",
             "folder_name": data.get("folder_name", "") if isinstance(data, dict) else ""
         }
@@ -1880,226 +2381,27 @@ def register_threshold_tweaker_callbacks(app):
         # Use image toggle states from state (default to empty dict if not set)
         image_toggle_states = image_toggle_states_state if (image_toggle_states_state and isinstance(image_toggle_states_state, dict)) else {}
         
-        # Use create_accordion_view for consistent UI with image viewer
-        accordion_view = create_accordion_view(
-            records_to_display,  # Use filtered records for display
-            current_page,
-            image_toggle_states,  # Use image toggle states from store
-            {},  # Audit tags
-            []   # Audit options
-        )
-        
-        # Create stats bar matching image viewer style
-        stats_bar = dbc.Card([
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col([
-                        html.Span("Total Records:", className="label fw-bold me-2"),
-                        html.Span(str(len(changed_records)), id="tweaker-total-records", className="value", style={"color": "#3b82f6", "fontSize": "1.2em"}),
-                    ], md=2),
-                    dbc.Col([
-                        html.Span("Filtered:", className="label fw-bold me-2"),
-                        html.Span(str(len(records_to_display)), id="tweaker-filtered-records", className="value", style={"color": "#3b82f6", "fontSize": "1.2em"}),
-                    ], md=2),
-                    dbc.Col([
-                        html.Span("Model:", className="label fw-bold me-2"),
-                        html.Span("New Model" if model == "new" else "Deployed Model", className="value", style={"color": "#3b82f6", "fontSize": "1.2em"}),
-                    ], md=3),
-                ])
-            ])
-        ], className="mb-4")
-        
-        # Create pagination controls matching image viewer
-        records_per_page = 10
-        total_pages = (len(records_to_display) + records_per_page - 1) // records_per_page
-        # Ensure current_page is within valid range
-        if current_page >= total_pages:
-            current_page = max(0, total_pages - 1)
-        start_idx = current_page * records_per_page
-        end_idx = min(start_idx + records_per_page, len(records_to_display))
-        
-        pagination = dbc.Card([
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col([
-                        dbc.ButtonGroup([
-                            dbc.Button("⏮️ First Page", id="tweaker-first-btn", color="primary", outline=True, size="sm"),
-                            dbc.Button("◀️ Prev", id="tweaker-prev-btn", color="primary", outline=True, size="sm"),
-                        ])
-                    ], md=4, className="d-flex justify-content-start"),
-                    dbc.Col([
-                        html.Div([
-                            html.Span("Records ", style={"fontSize": "0.9em"}),
-                            html.Span(id="tweaker-page-start", children=str(start_idx + 1), style={"fontSize": "1.2em", "fontWeight": "600", "color": "#3b82f6"}),
-                            html.Span("-", style={"margin": "0 4px"}),
-                            html.Span(id="tweaker-page-end", children=str(end_idx), style={"fontSize": "1.2em", "fontWeight": "600", "color": "#3b82f6"}),
-                            html.Span(" of ", style={"margin": "0 8px"}),
-                            html.Span(id="tweaker-total-filtered", children=str(len(records_to_display)), style={"fontSize": "1.2em", "fontWeight": "600"}),
-                        ], className="text-center", style={"lineHeight": "38px"})
-                    ], md=4),
-                    dbc.Col([
-                        dbc.ButtonGroup([
-                            dbc.Button("Next ▶️", id="tweaker-next-btn", color="primary", outline=True, size="sm"),
-                            dbc.Button("Last Page ⏭️", id="tweaker-last-btn", color="primary", outline=True, size="sm"),
-                        ])
-                    ], md=4, className="d-flex justify-content-end"),
-                ])
-            ])
-        ], className="mt-4")
-        
-        display = html.Div([
-            stats_bar,
-            accordion_view,
-            pagination
-        ])
-        
-        return display, store_data
+        display = _build_changed_records_display(changed_records, records_to_display, current_page, model, image_toggle_states)
+        return display, store_data, len(records_to_display)
     
-    # Clientside callback for expand/collapse rows in threshold tweaker
+    # Navigation buttons for tweaker pagination (clientside, see assets/tweaker.js)
     app.clientside_callback(
-        """
-        function(n_clicks_list) {
-            if (!n_clicks_list || n_clicks_list.length === 0) {
-                return window.dash_clientside.no_update;
-            }
-            
-            const ctx = window.dash_clientside.callback_context;
-            if (!ctx || !ctx.triggered || ctx.triggered.length === 0) {
-                return window.dash_clientside.no_update;
-            }
-            
-            const trigger = ctx.triggered[0];
-            const triggerId = trigger.prop_id;
-            
-            // Extract index from trigger ID
-            const match = triggerId.match(/\\{"type":"tweaker-expand-row","index":(\\d+)\\}/);
-            if (!match) {
-                return window.dash_clientside.no_update;
-            }
-            
-            const index = parseInt(match[1]);
-            const arrowId = `tweaker-arrow-${index}`;
-            const rowExpandedId = `tweaker-row-expanded-${index}`;
-            
-            const arrow = document.getElementById(arrowId);
-            const rowExpanded = document.getElementById(rowExpandedId);
-            
-            if (!arrow || !rowExpanded) {
-                return window.dash_clientside.no_update;
-            }
-            
-            // Toggle visibility
-            const isVisible = rowExpanded.style.display !== 'none';
-            
-            if (isVisible) {
-                rowExpanded.style.display = 'none';
-                arrow.style.transform = 'rotate(0deg)';
-            } else {
-                rowExpanded.style.display = 'table-row';
-                arrow.style.transform = 'rotate(90deg)';
-            }
-            
-            return window.dash_clientside.no_update;
-        }
-        """,
-        Output("tweaker-changed-records-display", "children", allow_duplicate=True),
-        Input({"type": "tweaker-expand-row", "index": ALL}, "n_clicks"),
-        prevent_initial_call=True
-    )
-    
-    # Navigation buttons for tweaker pagination
-    @app.callback(
+        ClientsideFunction(namespace="tweaker", function_name="navigateRecords"),
         Output("tweaker-current-page-store", "data", allow_duplicate=True),
         [Input("tweaker-first-btn", "n_clicks"),
          Input("tweaker-prev-btn", "n_clicks"),
          Input("tweaker-next-btn", "n_clicks"),
          Input("tweaker-last-btn", "n_clicks")],
-        [State("tweaker-changed-records-store", "data"),
+        [State("tweaker-filtered-count-store", "data"),
          State("tweaker-current-page-store", "data")],
         prevent_initial_call=True
     )
-    def navigate_tweaker_records(first_clicks, prev_clicks, next_clicks, last_clicks, changed_records_data, current_page):
-        """Navigate pages in tweaker changed records"""
-        ctx = callback_context
-        if not ctx.triggered:
-            return current_page or 0
-        
-        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-        
-        # Get filtered count from store
-        if not changed_records_data or not isinstance(changed_records_data, dict):
-            return 0
-        
-        records_to_display = changed_records_data.get("filtered", [])
-        if not records_to_display:
-            records_to_display = changed_records_data.get("data", [])
-        
-        filtered_count = len(records_to_display)
-        if filtered_count == 0:
-            return 0
-        
-        # Calculate total pages
-        total_pages = (filtered_count + 9) // 10  # Ceiling division
-        
-        # Navigate pages
-        if trigger_id == "tweaker-first-btn":
-            return 0
-        elif trigger_id == "tweaker-prev-btn":
-            return max(0, (current_page or 0) - 1)
-        elif trigger_id == "tweaker-next-btn":
-            return min(total_pages - 1, (current_page or 0) + 1)
-        elif trigger_id == "tweaker-last-btn":
-            return total_pages - 1
-        
-        return current_page or 0
     
-    # Update image toggle state store for tweaker
-    @app.callback(
+    # Update image toggle state store for tweaker (clientside, see assets/tweaker.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace="tweaker", function_name="toggleImageState"),
         Output("tweaker-image-toggle-state-store", "data", allow_duplicate=True),
         Input({"type": "image-toggle-btn", "side": ALL, "record_id": ALL}, "n_clicks"),
         State("tweaker-image-toggle-state-store", "data"),
         prevent_initial_call=True
     )
-    def update_tweaker_image_toggle_state(n_clicks_list, current_states):
-        """Update image toggle state for tweaker records"""
-        from dash import callback_context, no_update
-        
-        ctx = callback_context
-        if not ctx.triggered:
-            return no_update
-        
-        trigger = ctx.triggered[0]['prop_id']
-        if not trigger or '.n_clicks' not in trigger:
-            return no_update
-        
-        # Parse button ID to get side and record_id
-        import json
-        try:
-            button_id_str = trigger.split('.')[0]
-            button_id = json.loads(button_id_str)
-            side = button_id.get('side')
-            record_id = button_id.get('record_id')
-            
-            if not side or record_id is None:
-                return no_update
-            
-            # Initialize states if needed
-            if not current_states or not isinstance(current_states, dict):
-                current_states = {}
-            
-            # Get current state for this record and side
-            record_states = current_states.get(record_id, {})
-            if not isinstance(record_states, dict):
-                record_states = {}
-            
-            # Toggle state (default to 'input')
-            current_mode = record_states.get(side, 'input')
-            new_mode = 'result' if current_mode == 'input' else 'input'
-            
-            # Update nested structure
-            record_states[side] = new_mode
-            current_states[record_id] = record_states
-            
-            return current_states
-        except (json.JSONDecodeError, KeyError, AttributeError):
-            return no_update
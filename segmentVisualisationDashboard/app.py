@@ -37,6 +37,9 @@ app.title = "Segmentation Data Visualization Dashboard"
 # =============== CONFIGURATION ===============
 BASE_DIR = Path(__file__).parent
 
+# Marks of the modal overlay opacity slider (0-100%)
+_OPACITY_MARKS = {i: f"{i}%" for i in range(0, 101, 25)}
+
 # =============== LAYOUT COMPONENTS ===============
 
 def create_header():
@@ -92,7 +95,12 @@ app.layout = dbc.Container([
     create_header(),
     create_tab_navigation(),
     
-    html.Div(id="tab-content", className="tab-content-container", children=create_settings_tab()),
+    # All tabs are rendered once; switching tabs only toggles their visibility (clientside)
+    html.Div(id="tab-content", className="tab-content-container", children=[
+        html.Div(id="tab-settings", children=create_settings_tab()),
+        html.Div(id="tab-statistics", children=create_statistics_tab(), style={"display": "none"}),
+        html.Div(id="tab-viewer", children=create_image_viewer_tab(), style={"display": "none"}),
+    ]),
     
     # Modal for full image view
     dbc.Modal([
@@ -109,7 +117,7 @@ app.layout = dbc.Container([
                             max=100,
                             step=5,
                             value=100,
-                            marks={i: f"{i}%" for i in range(0, 101, 25)},
+                            marks=_OPACITY_MARKS,
                             tooltip={"placement": "bottom", "always_visible": True}
                         ),
                     ], style={"width": "300px", "display": "inline-block"}),
@@ -117,7 +125,11 @@ app.layout = dbc.Container([
             ]),
         ], style={"display": "flex", "alignItems": "center", "justifyContent": "space-between"}),
         dbc.ModalBody([
-            html.Img(id="modal-image", src="", style={"width": "100%", "height": "auto"}),
+            html.Div([
+                html.Img(id="modal-image", src="", style={"width": "100%", "height": "auto"}),
+                # Mask layer of the overlay view (opacity follows the slider clientside)
+                html.Img(id="modal-mask-image", src="", className="modal-mask-layer", style={"display": "none"}),
+            ], className="modal-image-stack"),
         ]),
         dbc.ModalFooter([
             dbc.Button("Close", id="close-modal", className="ms-auto", n_clicks=0)
@@ -129,20 +141,20 @@ app.layout = dbc.Container([
 
 # =============== CALLBACKS ===============
 
-@app.callback(
-    Output('tab-content', 'children'),
+# Show the active tab's content (clientside - no server round trip per tab click)
+app.clientside_callback(
+    """
+    function(activeTab) {
+        return ['settings', 'statistics', 'viewer'].map(function(tab) {
+            return tab === activeTab ? {} : {display: 'none'};
+        });
+    }
+    """,
+    [Output('tab-settings', 'style'),
+     Output('tab-statistics', 'style'),
+     Output('tab-viewer', 'style')],
     Input('main-tabs', 'active_tab')
 )
-def render_tab_content(active_tab):
-    """Render content based on active tab"""
-    if active_tab == "settings":
-        return create_settings_tab()
-    elif active_tab == "statistics":
-        return create_statistics_tab()
-    elif active_tab == "viewer":
-        return create_image_viewer_tab()
-    
-    return html.Div("Select a tab to begin")
 
 
 # Register component callbacks
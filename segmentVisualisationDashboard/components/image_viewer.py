@@ -3,10 +3,20 @@ Image Viewer Tab Component
 Display images with mask overlays in card-based layout similar to analysisDashboard
 """
 
-from dash import html, dcc, Input, Output, State, callback_context, ALL, MATCH
+from dash import html, dcc, Input, Output, State, callback_context, ALL, MATCH, no_update
 import dash_bootstrap_components as dbc
+from flask import Response, abort, request
 from pathlib import Path
+from collections import OrderedDict
+import copy
+import hashlib
+import hmac
+import json
+import os
 import sys
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image
 import numpy as np
 import base64
@@ -16,7 +26,37 @@ from io import BytesIO
 sys.path.append(str(Path(__file__).parent.parent))
 
 from utils.mask_processor import MaskProcessor
-from utils.image_utils import pil_to_base64, get_image_info
+from utils.image_utils import pil_to_base64, pil_to_bytes, get_image_info
+
+# Shared mask processor (stateless apart from its default palette, safe across card threads)
+_mask_processor = MaskProcessor()
+
+# Rendered card views (original/mask/overlay thumbnail URLs + image info), most recently used last
+_VIEW_CACHE = OrderedDict()
+_VIEW_CACHE_SIZE = 256
+_VIEW_CACHE_LOCK = threading.Lock()
+
+# Thumbnails of the cached views, served by name from the thumbnail route:
+# {name: (future of the view's three (bytes, mimetype) thumbnails, position of this one)}
+_THUMBNAILS = {}
+_THUMBNAIL_ROUTE = "/thumbnails"
+
+# Thumbnail URLs carry their signed view spec, so any server process (another gunicorn worker,
+# or this one after a restart) can re-render a thumbnail it has not cached. Set THUMBNAIL_SECRET
+# to the same value for all workers (or start gunicorn with --preload) to share the signing key
+_THUMBNAIL_SECRET = os.getenv("THUMBNAIL_SECRET", "").encode() or os.urandom(32)
+# Longest spec carried in a URL (larger label sets, e.g. many polygons, are only served by the
+# process that rendered them)
+_THUMBNAIL_SPEC_MAX = 2000
+
+# Decoded, modal-size (1200px) images of the records opened in the modal, most recently used last
+_MODAL_IMAGE_CACHE = OrderedDict()
+_MODAL_IMAGE_CACHE_SIZE = 8
+_MODAL_IMAGE_CACHE_LOCK = threading.Lock()
+
+# Card thumbnails render in the background, in parallel (PIL decode/resize/encode and numpy release the GIL)
+_CARD_WORKERS = min(5, os.cpu_count() or 1)
+_card_pool = ThreadPoolExecutor(max_workers=_CARD_WORKERS, thread_name_prefix="record-cards") if _CARD_WORKERS > 1 else None
 
 
 def create_image_viewer_tab():
@@ -74,6 +114,180 @@ def create_image_viewer_tab():
     ], fluid=True)
 
 
+def _open_resized(image_path, max_size, resample=Image.Resampling.LANCZOS, reducing_gap=None):
+    """
+    Open an image scaled down to at most max_size px on its longest side.
+    JPEGs are decoded in draft mode, at the smallest 1/2, 1/4 or 1/8 DCT scale that still
+    covers the target, instead of decoding every full-resolution pixel first.
+    
+    Args:
+        image_path: Image file
+        max_size: Longest side of the result
+        resample: PIL resampling filter (Lanczos by default)
+        reducing_gap: Optional PIL reducing_gap (box-reduce first for large downscales)
+    """
+    img = Image.open(image_path)
+    width, height = img.size
+    if width > max_size or height > max_size:
+        if img.format == 'JPEG':
+            img.draft(img.mode, (max_size, max_size))
+            width, height = img.size
+        scale = min(max_size / width, max_size / height)
+        if scale < 1:
+            new_width = int(width * scale)
+            new_height = int(height * scale)
+            return img.resize((new_width, new_height), resample, reducing_gap=reducing_gap)
+    img.load()
+    return img
+
+
+def _render_thumbnails(image_path, label_data, class_colors, overlay_opacity):
+    """
+    Encode the Original, Mask and Overlay thumbnails of an image.
+    
+    Returns:
+        Tuple of three (bytes, mimetype)
+    """
+    # Resize to the card thumbnail size (cards show images at most 300px tall, so 400px on the
+    # longest side is enough; the modal loads the full image separately, with Lanczos).
+    # Bilinear after a box reduction is indistinguishable from Lanczos at this size
+    img = _open_resized(image_path, 400, resample=Image.Resampling.BILINEAR, reducing_gap=2.0)
+    
+    # Create all three views from the one decoded image (the overlay works on its own array copy).
+    # Photographic views are JPEG thumbnails; the flat-colour mask stays PNG
+    original = pil_to_bytes(img, fmt="JPEG")
+    
+    if label_data:
+        overlay_img, mask_img = _mask_processor.create_mask_overlay(img, label_data, class_colors, opacity=overlay_opacity)
+        overlay = pil_to_bytes(overlay_img, fmt="JPEG")
+    else:
+        # No label data - show placeholder (the overlay is the original image)
+        mask_img = Image.new('RGB', img.size, (0, 0, 0))
+        overlay = original
+    
+    return original, pil_to_bytes(mask_img), overlay
+
+
+def _render_views(image_path, label_data, class_colors, overlay_opacity):
+    """
+    Thumbnail URLs of the Original, Mask and Overlay views of an image (the page carries short
+    URLs rather than inline base64 images), plus its image info.
+    The thumbnails render in the background on the card pool and the thumbnail route waits for
+    them, so a page's cards show at once and each image appears as soon as it is ready.
+    Views are cached per spec (image path, modification time, labels, colors, opacity), so
+    paging back to records already seen skips the decode, resize, overlay and encode; the
+    thumbnail names are the spec's signature, so browsers can cache them too, and the URLs
+    carry the spec itself (see _rebuild_thumbnail).
+    
+    Returns:
+        Tuple of (original_src, mask_src, overlay_src, img_info, classes)
+    """
+    cache_key = json.dumps(
+        [str(image_path), os.path.getmtime(image_path), label_data, class_colors, overlay_opacity],
+        sort_keys=True, default=str
+    )
+    with _VIEW_CACHE_LOCK:
+        cached = _VIEW_CACHE.get(cache_key)
+        # A failed background render is retried
+        if cached is not None and not (cached[2].done() and cached[2].exception() is not None):
+            _VIEW_CACHE.move_to_end(cache_key)
+            return cached[0]
+    
+    # Header only (cheap) - unreadable images fail here, as an error card, not in the background
+    img_info = get_image_info(image_path)
+    if img_info is None:
+        raise OSError(f"Cannot read image {image_path}")
+    
+    # Card metadata is settled before the background render, which works on its own copy of the
+    # labels (create_mask_overlay fills in missing classes)
+    label_data = copy.deepcopy(label_data)
+    classes = []
+    if label_data:
+        classes = label_data['classes'] = _mask_processor.detect_classes(label_data)
+    
+    if _card_pool is not None:
+        rendering = _card_pool.submit(_render_thumbnails, image_path, label_data, class_colors, overlay_opacity)
+    else:
+        rendering = Future()
+        rendering.set_result(_render_thumbnails(image_path, label_data, class_colors, overlay_opacity))
+    
+    spec = base64.urlsafe_b64encode(zlib.compress(cache_key.encode())).decode()
+    key_digest = hmac.new(_THUMBNAIL_SECRET, spec.encode(), hashlib.sha1).hexdigest()
+    names = [f"{key_digest}-original.jpg", f"{key_digest}-mask.png", f"{key_digest}-overlay.jpg"]
+    query = f"?spec={spec}" if len(spec) <= _THUMBNAIL_SPEC_MAX else ""
+    views = tuple(f"{_THUMBNAIL_ROUTE}/{name}{query}" for name in names) + (img_info, classes)
+    
+    with _VIEW_CACHE_LOCK:
+        _VIEW_CACHE[cache_key] = (views, names, rendering)
+        _VIEW_CACHE.move_to_end(cache_key)
+        for position, name in enumerate(names):
+            _THUMBNAILS[name] = (rendering, position)
+        if len(_VIEW_CACHE) > _VIEW_CACHE_SIZE:
+            _, (_, evicted_names, _) = _VIEW_CACHE.popitem(last=False)
+            for name in evicted_names:
+                _THUMBNAILS.pop(name, None)
+    return views
+
+
+def _rebuild_thumbnail(name, spec):
+    """
+    Re-render a thumbnail this process has not cached from the view spec in its URL.
+    The spec must carry this server's signature (its name), so URLs can't point at other files.
+    
+    Returns:
+        (future, position) as in _THUMBNAILS, or None if the spec is missing, unsigned or stale
+    """
+    key_digest = name.split("-", 1)[0].encode()
+    expected = hmac.new(_THUMBNAIL_SECRET, spec.encode(), hashlib.sha1).hexdigest().encode()
+    if not spec or not hmac.compare_digest(key_digest, expected):
+        return None
+    
+    try:
+        image_path, _, label_data, class_colors, overlay_opacity = json.loads(zlib.decompress(base64.urlsafe_b64decode(spec)))
+        _render_views(image_path, label_data, class_colors, overlay_opacity)
+    except Exception as e:
+        print(f"❌ Error rebuilding thumbnail {name}: {e}")
+        return None
+    
+    # A changed image file renders under a new name - the old one stays missing
+    with _VIEW_CACHE_LOCK:
+        return _THUMBNAILS.get(name)
+
+
+def _modal_image(image_path):
+    """
+    Load an image resized for the modal view (max 1200px on the longest side).
+    Cached per (image path, modification time), so opacity slider changes and switching
+    between a record's views only redo the overlay, not the decode and resize.
+    The returned image is shared - callers must not modify it.
+    """
+    cache_key = (str(image_path), os.path.getmtime(image_path))
+    with _MODAL_IMAGE_CACHE_LOCK:
+        cached = _MODAL_IMAGE_CACHE.get(cache_key)
+        if cached is not None:
+            _MODAL_IMAGE_CACHE.move_to_end(cache_key)
+            return cached
+    
+    # Resize for modal if too large (max 1200px for modal view)
+    img = _open_resized(image_path, 1200)
+    
+    with _MODAL_IMAGE_CACHE_LOCK:
+        _MODAL_IMAGE_CACHE[cache_key] = img
+        if len(_MODAL_IMAGE_CACHE) > _MODAL_IMAGE_CACHE_SIZE:
+            _MODAL_IMAGE_CACHE.popitem(last=False)
+    return img
+
+
+def _mask_layer(mask_img, drawn):
+    """
+    Mask-only image as a base64 RGBA PNG, transparent where no class is drawn
+    (drawn comes from the class map, so classes coloured black stay visible)
+    """
+    mask_array = np.array(mask_img)
+    alpha = np.where(drawn, 255, 0).astype(np.uint8)
+    return pil_to_base64(Image.fromarray(np.dstack([mask_array, alpha])))
+
+
 def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
     """Create a card for a single image record showing Original, Mask, and Overlay with expandable overlay section"""
     
@@ -81,35 +295,9 @@ def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
     image_name = record['image_name']
     label_data = record.get('label_data')
     
-    # Load images efficiently (only process what's needed)
+    # Thumbnail URLs (rendered in the background, cached across page visits)
     try:
-        img = Image.open(image_path)
-        
-        # Resize large images for display efficiency (max 800px on longest side)
-        max_display_size = 800
-        width, height = img.size
-        if width > max_display_size or height > max_display_size:
-            scale = min(max_display_size / width, max_display_size / height)
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        processor = MaskProcessor()
-        
-        # Create all three views
-        original_img = img.copy()
-        
-        if label_data:
-            overlay_img, mask_img = processor.create_mask_overlay(img, label_data, class_colors, opacity=overlay_opacity)
-        else:
-            # No label data - show placeholder
-            overlay_img = img.copy()
-            mask_img = Image.new('RGB', img.size, (0, 0, 0))
-        
-        # Convert to base64 for display
-        original_b64 = pil_to_base64(original_img)
-        mask_b64 = pil_to_base64(mask_img)
-        overlay_b64 = pil_to_base64(overlay_img)
+        original_src, mask_src, overlay_src, img_info, classes = _render_views(image_path, label_data, class_colors, overlay_opacity)
         
         # Create clickable images
         image_style = {
@@ -122,7 +310,7 @@ def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
         }
         
         original_img_elem = html.Img(
-            src=original_b64,
+            src=original_src,
             style=image_style,
             className="hover-shadow",
             id={"type": "image-clickable", "view": "original", "index": record_index},
@@ -130,7 +318,7 @@ def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
         )
         
         mask_img_elem = html.Img(
-            src=mask_b64,
+            src=mask_src,
             style=image_style,
             className="hover-shadow",
             id={"type": "image-clickable", "view": "mask", "index": record_index},
@@ -138,24 +326,21 @@ def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
         )
         
         overlay_img_elem = html.Img(
-            src=overlay_b64,
+            src=overlay_src,
             style=image_style,
             className="hover-shadow",
             id={"type": "image-clickable", "view": "overlay", "index": record_index},
             n_clicks=0
         )
         
-        # Get image info
-        img_info = get_image_info(image_path)
+        # Image info
         info_text = []
         if img_info:
             info_text.append(f"{img_info['width']} x {img_info['height']} px")
             info_text.append(f"{img_info['size_kb']} KB")
         
-        if label_data:
-            classes = label_data.get('classes', [])
-            if classes:
-                info_text.append(f"{len(classes)} class(es)")
+        if classes:
+            info_text.append(f"{len(classes)} class(es)")
         
         # Create card
         card = dbc.Card([
@@ -205,6 +390,27 @@ def create_record_card(record, record_index, class_colors, overlay_opacity=1.0):
 def register_image_viewer_callbacks(app):
     """Register callbacks for image viewer tab"""
     
+    # Record card thumbnails (a name always maps to the same image, so browsers may cache them)
+    @app.server.route(f"{_THUMBNAIL_ROUTE}/<name>")
+    def serve_thumbnail(name):
+        with _VIEW_CACHE_LOCK:
+            thumbnail = _THUMBNAILS.get(name)
+        if thumbnail is None:
+            # Rendered by another worker, or before a restart
+            thumbnail = _rebuild_thumbnail(name, request.args.get("spec", ""))
+        if thumbnail is None:
+            abort(404)
+        rendering, position = thumbnail
+        try:
+            data, mimetype = rendering.result()[position]
+        except Exception as e:
+            print(f"❌ Error rendering thumbnail {name}: {e}")
+            abort(404)
+        response = Response(data, mimetype=mimetype)
+        response.set_etag(name)
+        response.cache_control.max_age = 3600
+        return response.make_conditional(request)
+    
     @app.callback(
         [
             Output('viewer-stats', 'children'),
@@ -233,17 +439,9 @@ def register_image_viewer_callbacks(app):
         
         # Debug logging removed for cleaner console output
         
-        # Only process if we're on the viewer tab
+        # Only process if we're on the viewer tab (the hidden tab keeps its records and page)
         if active_tab != 'viewer':
-            return (
-                dbc.Alert("No data loaded. Please load data in Settings tab.", color="warning"),
-                "0", "1", "0",
-                html.Div([
-                    html.Div(className="spinner"),
-                    html.P("Load data in Settings tab to view images...", className="text-center mt-3", style={"color": "#3b82f6"})
-                ], className="text-center py-5"),
-                0
-            )
+            return (no_update,) * 6
         
         ctx = callback_context
         if not ctx.triggered:
@@ -302,6 +500,7 @@ def register_image_viewer_callbacks(app):
         opacity_dict = opacity_store or {}
         
         # Create cards for each record with individual opacity values
+        # (cheap - their thumbnails render in the background, see _render_views)
         cards = []
         for idx, record in enumerate(page_records):
             global_idx = start_idx + idx
@@ -339,12 +538,13 @@ def register_image_viewer_callbacks(app):
     @app.callback(
         [Output("image-modal", "is_open"),
          Output("modal-image", "src"),
+         Output("modal-mask-image", "src"),
+         Output("modal-mask-image", "style"),
          Output("modal-overlay-controls", "style"),
          Output("modal-state-store", "data"),
          Output("modal-overlay-opacity-slider", "value")],
         [Input({"type": "image-clickable", "view": ALL, "index": ALL}, "n_clicks"),
-         Input("close-modal", "n_clicks"),
-         Input("modal-overlay-opacity-slider", "value")],
+         Input("close-modal", "n_clicks")],
         [State("data-store", "data"),
          State("class-colors-store", "data"),
          State("overlay-opacity-store", "data"),
@@ -352,12 +552,16 @@ def register_image_viewer_callbacks(app):
          State("modal-state-store", "data")],
         prevent_initial_call=True
     )
-    def toggle_image_modal(n_clicks_list, close_clicks, slider_value, data_store, class_colors, opacity_store, is_open, modal_state):
-        """Handle image modal opening/closing with overlay controls"""
+    def toggle_image_modal(n_clicks_list, close_clicks, data_store, class_colors, opacity_store, is_open, modal_state):
+        """
+        Handle image modal opening/closing with overlay controls.
+        The overlay view of a mask-labelled record is the image with its mask as a separate layer,
+        so opacity slider changes are applied in the browser (see below) without a server render.
+        """
         
         ctx = callback_context
         if not ctx.triggered:
-            return False, "", {"display": "none"}, modal_state or {'view': None, 'index': None}, 100
+            return False, "", "", {"display": "none"}, {"display": "none"}, modal_state or {'view': None, 'index': None}, 100
         
         trigger = ctx.triggered[0]['prop_id']
         trigger_value = ctx.triggered[0]['value']
@@ -365,56 +569,7 @@ def register_image_viewer_callbacks(app):
         
         # Close modal
         if "close-modal" in trigger:
-            return False, "", {"display": "none"}, {'view': None, 'index': None}, 100
-        
-        # Handle overlay opacity slider change
-        if "modal-overlay-opacity-slider" in trigger:
-            if slider_value is None:
-                return is_open, "", {"display": "none"}, modal_state, 100
-            # Get current modal state to know which image we're viewing
-            view = modal_state.get('view')
-            index = modal_state.get('index')
-            
-            if view != 'overlay' or index is None:
-                return is_open, "", {"display": "none"}, modal_state, slider_value or 100
-            
-            if not data_store or 'data' not in data_store:
-                return is_open, "", {"display": "none"}, modal_state, slider_value or 100
-            
-            data = data_store['data']
-            if index >= len(data):
-                return is_open, "", {"display": "none"}, modal_state, slider_value or 100
-            
-            record = data[index]
-            image_path = record['image_path']
-            label_data = record.get('label_data')
-            
-            if not label_data:
-                return is_open, "", {"display": "none"}, modal_state, slider_value or 100
-            
-            # Update opacity store
-            opacity_store = opacity_store or {}
-            opacity_store[index] = slider_value
-            
-            # Regenerate image with new opacity
-            try:
-                img = Image.open(image_path)
-                max_modal_size = 1200
-                width, height = img.size
-                if width > max_modal_size or height > max_modal_size:
-                    scale = min(max_modal_size / width, max_modal_size / height)
-                    new_width = int(width * scale)
-                    new_height = int(height * scale)
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                processor = MaskProcessor()
-                opacity_float = slider_value / 100.0
-                overlay_img, _ = processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
-                img_b64 = pil_to_base64(overlay_img)
-                
-                return is_open, img_b64, {"display": "block", "marginLeft": "20px", "minWidth": "350px"}, modal_state, slider_value
-            except Exception as e:
-                return is_open, "", {"display": "none"}, modal_state, slider_value or 100
+            return False, "", "", {"display": "none"}, {"display": "none"}, {'view': None, 'index': None}, 100
         
         # Open modal with clicked image
         if "image-clickable" in trigger:
@@ -429,37 +584,26 @@ def register_image_viewer_callbacks(app):
                 # Check if this is actually a click (n_clicks should be > 0)
                 # Note: trigger_value might be None on first render, so we check if it's a valid click
                 if trigger_value is None:
-                    return is_open, "", {"display": "none"}, modal_state, 100
+                    return is_open, "", "", {"display": "none"}, {"display": "none"}, modal_state, 100
                 
                 # Store modal state
                 new_modal_state = {'view': view, 'index': index}
                 
                 if not data_store or 'data' not in data_store:
-                    return False, "", {"display": "none"}, new_modal_state, 100
+                    return False, "", "", {"display": "none"}, {"display": "none"}, new_modal_state, 100
                 
                 data = data_store['data']
                 filtered_data = data
                 
                 if index >= len(filtered_data):
-                    return False, "", {"display": "none"}, new_modal_state, 100
+                    return False, "", "", {"display": "none"}, {"display": "none"}, new_modal_state, 100
                 
                 record = filtered_data[index]
                 image_path = record['image_path']
                 label_data = record.get('label_data')
                 
-                # Load and process image based on view type
-                img = Image.open(image_path)
-                
-                # Resize for modal if too large (max 1200px for modal view)
-                max_modal_size = 1200
-                width, height = img.size
-                if width > max_modal_size or height > max_modal_size:
-                    scale = min(max_modal_size / width, max_modal_size / height)
-                    new_width = int(width * scale)
-                    new_height = int(height * scale)
-                    img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                processor = MaskProcessor()
+                # Load (resized for the modal, cached) and process image based on view type
+                img = _modal_image(image_path)
                 
                 # Get opacity for this record from store
                 opacity_store = opacity_store or {}
@@ -472,17 +616,26 @@ def register_image_viewer_callbacks(app):
                     # Show overlay opacity slider in header
                     controls_style = {"display": "block", "marginLeft": "20px", "minWidth": "350px"}
                 
+                mask_layer_b64 = ""
+                mask_layer_style = {"display": "none"}
                 if view == 'original':
                     display_img = img
                 elif view == 'mask':
                     if label_data:
-                        _, mask_img = processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
+                        _, mask_img = _mask_processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
                         display_img = mask_img
                     else:
                         display_img = Image.new('RGB', img.size, (0, 0, 0))
                 else:  # overlay
-                    if label_data:
-                        overlay_img, _ = processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
+                    if label_data and label_data.get('format', 'mask') == 'mask':
+                        # Opacity-blended masks: the image plus a transparent mask layer at the record's opacity
+                        _, mask_img = _mask_processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
+                        display_img = img
+                        mask_layer_b64 = _mask_layer(mask_img, _mask_processor.drawn_pixels(label_data, (img.height, img.width)))
+                        mask_layer_style = {"opacity": opacity_float}
+                    elif label_data:
+                        # Polygon/box labels are drawn at full opacity
+                        overlay_img, _ = _mask_processor.create_mask_overlay(img, label_data, class_colors or {}, opacity=opacity_float)
                         display_img = overlay_img
                     else:
                         display_img = img
@@ -490,11 +643,27 @@ def register_image_viewer_callbacks(app):
                 # Convert to base64
                 img_b64 = pil_to_base64(display_img)
                 
-                return True, img_b64, controls_style, new_modal_state, opacity_value
+                return True, img_b64, mask_layer_b64, mask_layer_style, controls_style, new_modal_state, opacity_value
             except Exception as e:
-                return False, "", {"display": "none"}, {'view': None, 'index': None}, 100
+                return False, "", "", {"display": "none"}, {"display": "none"}, {'view': None, 'index': None}, 100
         
-        return False, "", {"display": "none"}, modal_state, 100
+        return False, "", "", {"display": "none"}, {"display": "none"}, modal_state, 100
+    
+    # Blend the modal mask layer by the opacity slider (clientside - no server render per change)
+    app.clientside_callback(
+        """
+        function(opacity, maskSrc) {
+            if (!maskSrc) {
+                return {display: 'none'};
+            }
+            return {opacity: (opacity == null ? 100 : opacity) / 100};
+        }
+        """,
+        Output("modal-mask-image", "style", allow_duplicate=True),
+        Input("modal-overlay-opacity-slider", "value"),
+        State("modal-mask-image", "src"),
+        prevent_initial_call=True
+    )
     
     @app.callback(
         Output('overlay-opacity-store', 'data'),
@@ -9,12 +9,34 @@ from PIL import Image
 import numpy as np
 
 
-def pil_to_base64(image):
-    """Convert PIL Image to base64 string for display in Dash"""
+def pil_to_bytes(image, fmt="PNG", quality=85):
+    """
+    Encode PIL Image as PNG or JPEG bytes
+    
+    Args:
+        image: PIL Image
+        fmt: "PNG" (lossless, for masks and full views) or "JPEG" (much smaller and faster for photographic thumbnails)
+        quality: JPEG quality (ignored for PNG)
+    
+    Returns:
+        Tuple of (encoded bytes, mimetype)
+    """
     buffered = BytesIO()
+    if fmt == "JPEG":
+        # JPEG has no alpha/palette support
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        image.save(buffered, format="JPEG", quality=quality)
+        return buffered.getvalue(), "image/jpeg"
     image.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    return f"data:image/png;base64,{img_str}"
+    return buffered.getvalue(), "image/png"
+
+
+def pil_to_base64(image, fmt="PNG", quality=85):
+    """Convert PIL Image to base64 string for display in Dash (see pil_to_bytes for fmt/quality)"""
+    data, mimetype = pil_to_bytes(image, fmt=fmt, quality=quality)
+    img_str = base64.b64encode(data).decode()
+    return f"data:{mimetype};base64,{img_str}"
 
 
 def get_image_info(image_path):
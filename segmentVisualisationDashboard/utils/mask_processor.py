@@ -6,9 +6,38 @@ Process masks and create overlays with RGB colors (Red, Green, Blue)
 import numpy as np
 from PIL import Image
 import cv2
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
+def _load_class_map(mask_path, mtime, size):
+    """
+    Load a pixel-level mask resized (nearest) to size = (height, width).
+    Cached per (path, modification time, size), so a record's card, mask and overlay views
+    and repeated modal opens decode and resize its mask once. The array is shared (read-only).
+    """
+    mask_array = np.array(Image.open(mask_path))
+    
+    # Ensure mask_array matches image dimensions
+    h, w = size
+    if mask_array.shape[:2] != (h, w):
+        mask_array = cv2.resize(mask_array, (w, h), interpolation=cv2.INTER_NEAREST)
+    mask_array.setflags(write=False)
+    return mask_array
+
+
+@lru_cache(maxsize=256)
+def _mask_classes(mask_path, mtime):
+    """
+    Detect the class IDs of a pixel-level mask at full resolution (small classes can vanish
+    from a resized class map). Cached per (path, modification time).
+    """
+    unique_classes = np.unique(np.array(Image.open(mask_path)))
+    return tuple(unique_classes[unique_classes > 0].tolist())
+
+
 class MaskProcessor:
     """Process masks and create visualizations"""
     
@@ -36,6 +65,32 @@ class MaskProcessor:
         color_idx = int(class_id) % len(self.colors)
         return self.colors[color_idx]
     
+    def detect_classes(self, label_data):
+        """
+        Get the class IDs of label data, detecting them from the full-resolution mask
+        (pixel-level masks only) when the loader left them empty
+        """
+        classes = label_data.get('classes', [])
+        if not classes and label_data.get('format', 'mask') == 'mask':
+            mask_path = Path(label_data['mask_path'])
+            classes = list(_mask_classes(str(mask_path), os.path.getmtime(mask_path)))
+        return classes
+    
+    def drawn_pixels(self, label_data, size):
+        """
+        Pixels a pixel-level mask draws a class on, as create_mask_overlay does
+        
+        Args:
+            label_data: Label data from label_loader (mask format)
+            size: (height, width) of the image the mask is drawn on
+        
+        Returns:
+            Boolean (height, width) array
+        """
+        mask_path = Path(label_data['mask_path'])
+        mask_array = _load_class_map(str(mask_path), os.path.getmtime(mask_path), size)
+        return np.isin(mask_array, self.detect_classes(label_data))
+    
     def create_mask_overlay(self, image, label_data, class_colors_map=None, opacity=1.0):
         """
         Create mask overlay on image
@@ -50,7 +105,7 @@ class MaskProcessor:
             overlay_image: PIL Image with mask overlay
             mask_only_image: PIL Image showing only masks
         """
-        # Convert image to numpy array if PIL Image
+        # Convert image to numpy array if PIL Image (either way a private copy, drawn on directly)
         if isinstance(image, Image.Image):
             img_array = np.array(image)
         else:
@@ -65,44 +120,39 @@ class MaskProcessor:
         h, w = img_array.shape[:2]
         
         # Create overlay and mask-only images
-        overlay = img_array.copy()
+        overlay = img_array
         mask_only = np.zeros((h, w, 3), dtype=np.uint8)
         
         label_format = label_data.get('format', 'mask')
         
         if label_format == 'mask':
-            # Pixel-level mask - lazy load on-demand
+            # Pixel-level mask - lazy load on-demand (resized to the image, cached)
             mask_path = Path(label_data['mask_path'])
-            
-            # Load mask array only when needed for visualization
-            mask_img = Image.open(mask_path)
-            mask_array = np.array(mask_img)
+            mask_array = _load_class_map(str(mask_path), os.path.getmtime(mask_path), (h, w))
             
             # Detect classes from mask if not already detected
             classes = label_data.get('classes', [])
             if not classes:
-                # Detect classes on-demand
-                unique_classes = np.unique(mask_array)
-                classes = unique_classes[unique_classes > 0].tolist()
+                # Detect classes on-demand (on the full-resolution mask, not the resized map)
+                classes = self.detect_classes(label_data)
                 # Update label_data for future use
                 label_data['classes'] = classes
             
-            # Ensure mask_array matches image dimensions
-            if mask_array.shape[:2] != (h, w):
-                mask_array = cv2.resize(mask_array, (w, h), interpolation=cv2.INTER_NEAREST)
+            # Weight of the original pixel under a mask (float32, as the per-pixel blend below)
+            keep = np.float32(1.0) - np.float32(opacity)
             
             for class_id in classes:
                 color = self.get_color_for_class(class_id, class_colors_map)
-                mask = (mask_array == class_id).astype(np.float32)
+                mask = mask_array == class_id
+                if not mask.any():
+                    continue
                 
-                # Apply color overlay with opacity blending
-                for c in range(3):
-                    # Blend overlay color with original image based on opacity
-                    # Formula: result = original * (1 - opacity * mask) + overlay_color * opacity * mask
-                    overlay[:, :, c] = (overlay[:, :, c].astype(np.float32) * (1.0 - opacity * mask) + 
-                                       color[c] * opacity * mask).astype(np.uint8)
-                    # Mask-only image always shows full color (100% opacity)
-                    mask_only[:, :, c] = np.where(mask > 0, color[c], mask_only[:, :, c]).astype(np.uint8)
+                # Apply color overlay with opacity blending, on the masked pixels only (all channels at once)
+                # Formula: result = original * (1 - opacity) + overlay_color * opacity
+                tint = np.array([color[c] * opacity for c in range(3)], dtype=np.float32)
+                overlay[mask] = (overlay[mask].astype(np.float32) * keep + tint).astype(np.uint8)
+                # Mask-only image always shows full color (100% opacity)
+                mask_only[mask] = color[:3]
         
         elif label_format in ['yolo', 'voc', 'json']:
             # Polygon-based masks
@@ -134,9 +184,9 @@ class MaskProcessor:
                         cv2.fillPoly(mask, [points], 255)
                         
                         # Apply overlay (100% opacity)
-                        for c in range(3):
-                            overlay[:, :, c] = np.where(mask > 0, color[c], overlay[:, :, c])
-                            mask_only[:, :, c] = np.where(mask > 0, color[c], mask_only[:, :, c])
+                        filled = mask > 0
+                        overlay[filled] = color[:3]
+                        mask_only[filled] = color[:3]
                 
                 elif mask_info.get('type') == 'bbox':
                     bbox = mask_info.get('bbox', [])
@@ -2,6 +2,7 @@
 Data loading and processing utilities
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, List, Optional
@@ -88,14 +89,14 @@ def prepare_matrix_data(
             'recalls': {}
         }
     
-    # Normalize values
+    # Normalize values (once per distinct value, then mapped back onto the rows)
     if question_name:
-        valid_df['predicted_normalized'] = valid_df[predicted_col].apply(
-            lambda x: normalize_category_for_confusion_matrix(x, question_name)
-        )
-        valid_df['actual_normalized'] = valid_df[actual_col].apply(
-            lambda x: normalize_category_for_confusion_matrix(x, question_name)
-        )
+        for source_col, target_col in ((predicted_col, 'predicted_normalized'), (actual_col, 'actual_normalized')):
+            normalized = {
+                value: normalize_category_for_confusion_matrix(value, question_name)
+                for value in valid_df[source_col].unique()
+            }
+            valid_df[target_col] = valid_df[source_col].map(normalized)
     else:
         valid_df['predicted_normalized'] = valid_df[predicted_col].astype(str).str.lower().str.strip()
         valid_df['actual_normalized'] = valid_df[actual_col].astype(str).str.lower().str.strip()
@@ -132,47 +133,41 @@ def prepare_matrix_data(
             'recalls': {}
         }
     
-    # Initialize matrix
-    matrix = {actual: {pred: 0 for pred in labels} for actual in labels}
-    cell_records = {actual: {pred: [] for pred in labels} for actual in labels}
+    # Count (actual, predicted) pairs in one pass on integer codes
+    num_labels = len(labels)
+    label_index = {label: i for i, label in enumerate(labels)}
+    actual_codes = valid_df['actual_normalized'].map(label_index).to_numpy(dtype=np.int64)
+    predicted_codes = valid_df['predicted_normalized'].map(label_index).to_numpy(dtype=np.int64)
+    counts = np.bincount(
+        actual_codes * num_labels + predicted_codes,
+        minlength=num_labels * num_labels
+    ).reshape(num_labels, num_labels)
     
-    correct = 0
-    for _, row in valid_df.iterrows():
-        predicted = row['predicted_normalized']
-        actual = row['actual_normalized']
-        
-        if predicted in labels and actual in labels:
-            matrix[actual][predicted] += 1
-            cell_records[actual][predicted].append(row.to_dict())
-            if predicted == actual:
-                correct += 1
+    correct = int(np.trace(counts))
+    
+    # Group records by cell
+    cell_records = {actual: {pred: [] for pred in labels} for actual in labels}
+    for actual_code, predicted_code, record in zip(actual_codes, predicted_codes, valid_df.to_dict('records')):
+        cell_records[labels[actual_code]][labels[predicted_code]].append(record)
     
     # Convert to 2D array
-    z_data = [[matrix[actual][pred] for pred in labels] for actual in labels]
+    z_data = counts.tolist()
     
     accuracy = (correct / len(valid_df) * 100) if len(valid_df) > 0 else 0
     
     # Calculate precision and recall for each category
-    precisions = []
-    recalls = []
-    
-    for i, label in enumerate(labels):
-        # True Positives: diagonal element
-        tp = z_data[i][i]
-        
-        # False Positives: sum of column i (excluding diagonal)
-        fp = sum(z_data[j][i] for j in range(len(labels)) if j != i)
-        
-        # False Negatives: sum of row i (excluding diagonal)
-        fn = sum(z_data[i][j] for j in range(len(labels)) if j != i)
-        
-        # Precision = TP / (TP + FP)
-        precision = (tp / (tp + fp) * 100) if (tp + fp) > 0 else 0
-        precisions.append(precision)
-        
-        # Recall = TP / (TP + FN)
-        recall = (tp / (tp + fn) * 100) if (tp + fn) > 0 else 0
-        recalls.append(recall)
+    # True Positives: diagonal, False Positives: rest of the column, False Negatives: rest of the row
+    tp = np.diag(counts)
+    predicted_totals = counts.sum(axis=0)
+    actual_totals = counts.sum(axis=1)
+    precisions = [
+        float(tp[i] / predicted_totals[i] * 100) if predicted_totals[i] > 0 else 0
+        for i in range(num_labels)
+    ]
+    recalls = [
+        float(tp[i] / actual_totals[i] * 100) if actual_totals[i] > 0 else 0
+        for i in range(num_labels)
+    ]
     
     # Macro-averaged precision and recall (average across all classes)
     macro_precision = sum(precisions) / len(precisions) if len(precisions) > 0 else 0
@@ -18,7 +18,7 @@ import seaborn as sns
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .threshold_handler import (
@@ -267,10 +267,11 @@ class ReportGenerator:
         
         question_thresholds = self.threshold_config[self.question_name]
         severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
         
         contributing_sides_list = []
         
+        active_sides = self._active_sides(df, question_thresholds, lambda side: f"{side}_score")
+        
         for idx, row in df.iterrows():
             cscan_answer = row['cscan_answer']
             
@@ -281,19 +282,11 @@ class ReportGenerator:
             
             side_categories = []  # List of tuples: (side, category, score)
             
-            for side in sides:
-                score_col = f"{side}_score"
-                if score_col not in df.columns:
-                    continue
-                
+            for side, score_col, side_thresholds in active_sides:
                 score = row[score_col]
                 if pd.isna(score):
                     continue
                 
-                if side not in question_thresholds:
-                    continue
-                
-                side_thresholds = question_thresholds[side]
                 category = get_category_from_score(score, side_thresholds)
                 
                 if category:
@@ -381,11 +374,14 @@ class ReportGenerator:
         
         question_thresholds = self.threshold_config[self.question_name]
         severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
         
         result_df = df.copy()
         result_df[output_col] = None
         
+        active_sides = self._active_sides(
+            df, question_thresholds, lambda side: f'{prefix}{side}_score' if prefix else f'{side}_score'
+        )
+        
         for idx, row in df.iterrows():
             cscan_answer = row.get(cscan_col)
             
@@ -394,19 +390,11 @@ class ReportGenerator:
             
             side_categories = []
             
-            for side in sides:
-                score_col = f'{prefix}{side}_score' if prefix else f'{side}_score'
-                if score_col not in df.columns:
-                    continue
-                
+            for side, score_col, side_thresholds in active_sides:
                 score = row.get(score_col)
                 if pd.isna(score):
                     continue
                 
-                if side not in question_thresholds:
-                    continue
-                
-                side_thresholds = question_thresholds[side]
                 category = get_category_from_score(score, side_thresholds)
                 side_categories.append((side, category, score))
             
@@ -636,6 +624,54 @@ class ReportGenerator:
 
         return result_df
     
+    def _active_sides(self, df: pd.DataFrame, question_thresholds: Dict, score_col_fn: Callable[[str], str]) -> List[Tuple]:
+        """
+        Sides with both a score column and thresholds - the same for every row
+        
+        Args:
+            df: DataFrame with the score columns
+            question_thresholds: Thresholds per side for the question
+            score_col_fn: Maps a side to its score column name
+            
+        Returns:
+            (side, score column, side thresholds) tuples
+        """
+        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
+        return [
+            (side, score_col_fn(side), question_thresholds[side])
+            for side in sides
+            if score_col_fn(side) in df.columns and side in question_thresholds
+        ]
+    
+    def _side_severity_ranks(self, df: pd.DataFrame, active_sides: List[Tuple], severity_order: List[str]) -> np.ndarray:
+        """
+        Severity rank of each row's category on every active side
+        
+        Args:
+            df: DataFrame with the score columns
+            active_sides: (side, score column, side thresholds) tuples
+            severity_order: Categories from most to least severe
+            
+        Returns:
+            (rows x sides) int16 array; len(severity_order) where a side has no category
+        """
+        severity_rank = {category: rank for rank, category in enumerate(severity_order)}
+        no_category = len(severity_order)
+        
+        # Side-major layout so the per-row min across sides runs over contiguous columns
+        ranks = np.full((len(df), len(active_sides)), no_category, dtype=np.int16, order='F')
+        for column, (side, score_col, side_thresholds) in enumerate(active_sides):
+            scores = df[score_col]
+            present = scores.notna().to_numpy()
+            # Categorize each distinct score once
+            score_ranks = {
+                score: severity_rank.get(get_category_from_score(score, side_thresholds), no_category)
+                for score in scores[present].unique()
+            }
+            ranks[present, column] = scores[present].map(score_ranks).to_numpy(dtype=np.int16)
+        
+        return ranks
+    
     def create_new_cscan_answer(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Create new_cscan_answer and new_contributing_sides columns based on thresholds
@@ -652,62 +688,31 @@ class ReportGenerator:
         
         question_thresholds = self.threshold_config[self.question_name]
         severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
         
-        new_answers = []
-        new_contributing_sides_list = []
-        
-        for idx, row in df.iterrows():
-            side_categories = []  # List of tuples: (side, category, score)
-            
-            for side in sides:
-                score_col = f"new_{side}_score"
-                if score_col not in df.columns:
-                    continue
-                
-                score = row[score_col]
-                if pd.isna(score):
-                    continue
-                
-                if side not in question_thresholds:
-                    continue
-                
-                side_thresholds = question_thresholds[side]
-                category = get_category_from_score(score, side_thresholds)
-                
-                if category:
-                    side_categories.append((side, category, score))
-            
-            # Determine final answer based on severity priority
-            if not side_categories:
-                new_answers.append(None)
-                new_contributing_sides_list.append(None)
-            else:
-                # Extract all unique categories from all sides
-                all_categories = [cat for _, cat, _ in side_categories]
-                
-                # Priority-based selection: check categories in severity order (highest first)
-                final_answer = None
-                for category in severity_order:
-                    if category in all_categories:
-                        final_answer = category
-                        break
-                
-                # Fallback: if no match found, use first category (shouldn't happen)
-                if final_answer is None:
-                    final_answer = all_categories[0] if all_categories else None
-                
-                # Check if final_answer is the least severe category
-                # If so, don't populate contributing_sides
-                if is_least_severe_category(final_answer, self.question_name, self.threshold_config):
-                    new_answers.append(final_answer)
-                    new_contributing_sides_list.append(None)
-                else:
-                    # Find all sides that contributed to this final answer
-                    contributing_sides = [side for side, cat, _ in side_categories if cat == final_answer]
-                    
-                    new_answers.append(final_answer)
-                    new_contributing_sides_list.append(', '.join(contributing_sides) if contributing_sides else None)
+        active_sides = self._active_sides(df, question_thresholds, lambda side: f"new_{side}_score")
+        
+        # Determine final answer based on severity priority: the most severe (lowest ranked)
+        # category across the sides
+        ranks = self._side_severity_ranks(df, active_sides, severity_order)
+        no_category = len(severity_order)
+        final_ranks = ranks.min(axis=1) if active_sides else np.full(len(df), no_category, dtype=np.int16)
+        new_answers = np.array(list(severity_order) + [None], dtype=object)[final_ranks].tolist()
+        
+        # Find all sides that contributed to the final answer - none when there is no answer or it
+        # is the least severe category. Each row's contributing sides are encoded as a bitmask so
+        # every distinct combination is joined into a string only once
+        hidden_ranks = [no_category] + [
+            rank for rank, category in enumerate(severity_order)
+            if is_least_severe_category(category, self.question_name, self.threshold_config)
+        ]
+        contributes = (ranks == final_ranks[:, np.newaxis]) & ~np.isin(final_ranks, hidden_ranks)[:, np.newaxis]
+        side_bits = contributes.astype(np.int64) @ (1 << np.arange(len(active_sides), dtype=np.int64))
+        side_names = [side for side, _, _ in active_sides]
+        contributing_sides_by_bits = {
+            bits: ', '.join(side for i, side in enumerate(side_names) if bits >> i & 1) or None
+            for bits in np.unique(side_bits).tolist()
+        }
+        new_contributing_sides_list = [contributing_sides_by_bits[bits] for bits in side_bits.tolist()]
         
         # Add new_cscan_answer and new_contributing_sides columns after final_answer
         result_df = df.copy()
@@ -1380,44 +1385,16 @@ class ReportGenerator:
         
         question_thresholds = self.threshold_config[self.question_name]
         severity_order = get_severity_order_from_thresholds(question_thresholds)
-        sides = ['top', 'bottom', 'left', 'right', 'back', 'front']
         
-        new_answers = []
+        active_sides = self._active_sides(
+            df, question_thresholds, lambda side: f'new_{prefix}{side}_score' if prefix else f'new_{side}_score'
+        )
         
-        for idx, row in df.iterrows():
-            side_categories = []
-            
-            for side in sides:
-                score_col = f'new_{prefix}{side}_score' if prefix else f'new_{side}_score'
-                if score_col not in df.columns:
-                    continue
-                
-                score = row.get(score_col)
-                if pd.isna(score):
-                    continue
-                
-                if side not in question_thresholds:
-                    continue
-                
-                side_thresholds = question_thresholds[side]
-                category = get_category_from_score(score, side_thresholds)
-                side_categories.append((side, category, score))
-            
-            if not side_categories:
-                new_answers.append(None)
-                continue
-            
-            all_categories = [cat for _, cat, _ in side_categories]
-            final_answer = None
-            for category in severity_order:
-                if category in all_categories:
-                    final_answer = category
-                    break
-            
-            if final_answer is None:
-                final_answer = all_categories[0] if all_categories else None
-            
-            new_answers.append(final_answer)
+        # Most severe (lowest ranked) category across the sides
+        ranks = self._side_severity_ranks(df, active_sides, severity_order)
+        no_category = len(severity_order)
+        final_ranks = ranks.min(axis=1) if active_sides else np.full(len(df), no_category, dtype=np.int16)
+        new_answers = np.array(list(severity_order) + [None], dtype=object)[final_ranks].tolist()
         
         result_df = df.copy()
         result_df[output_col] = new_answers